@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Sequence
+from typing import Any, Callable, List, Optional, Sequence
 
 import numpy as np
 from numpy.typing import NDArray
@@ -67,6 +67,24 @@ class CableLoad:
     auto_update: bool
 
 
+@dataclass
+class _AssembledSystem:
+    """Assembled stiffness matrix and solver state for one mesh/convection pair."""
+
+    mesh: StructuredMesh
+    surface_convection_w_per_m2k: float
+    prefer_direct: bool
+    direct_threshold: int
+    mesh_tri: "MeshTri"
+    triangle_to_cell: NDArray[np.int64]
+    basis: "Basis"
+    stiffness_matrix: Any
+    stiffness_csc: Any
+    robin_unit_load: NDArray[np.float64]
+    direct_solver: Optional[Callable[[NDArray[np.float64]], NDArray[np.float64]]]
+    preconditioner: Optional["LinearOperator"]
+
+
 @BilinearForm
 def _diffusion_form(u, v, w):
     return w["k"] * dot(grad(u), grad(v))
@@ -96,6 +114,41 @@ class CableFemAnalyzer:
         self._heat_tolerance = max(heat_tolerance_w_per_m, 0.0)
         self._prefer_direct = prefer_direct_solver
         self._direct_threshold = max(1, direct_solver_threshold)
+        self._system_cache: Optional[_AssembledSystem] = None
+
+    def configure(
+        self,
+        *,
+        max_iterations: Optional[int] = None,
+        tolerance_c: Optional[float] = None,
+    ) -> None:
+        """Update iteration limits while keeping any cached assembly/factorisation."""
+        if max_iterations is not None:
+            self._max_iterations = max(1, max_iterations)
+        if tolerance_c is not None:
+            self._tolerance = max(tolerance_c, 1e-9)
+
+    def solves_directly(
+        self,
+        mesh: StructuredMesh,
+        *,
+        surface_convection_w_per_m2k: float = 8.0,
+    ) -> bool:
+        """Whether ``mesh`` is solved by a direct factorisation, which ignores ``initial_guess``.
+
+        The answer comes from the assembled system itself, which is cached for the
+        following :meth:`solve` on the same mesh and convection.
+        """
+        if _IMPORT_ERROR is not None:
+            return False
+        system = self._assembled_system(
+            mesh,
+            np.asarray(mesh.x_nodes_mm, dtype=float),
+            np.asarray(mesh.y_nodes_mm, dtype=float),
+            1.0 / np.maximum(np.asarray(mesh.thermal_resistivity_k_m_per_w, dtype=float), _MIN_RESISTIVITY),
+            surface_convection_w_per_m2k,
+        )
+        return system.direct_solver is not None
 
     def solve(
         self,
@@ -106,6 +159,7 @@ class CableFemAnalyzer:
         surface_convection_w_per_m2k: float = 8.0,
         progress_callback: Optional[Callable[[float], None]] = None,
         simplified_constant_rho: bool = False,
+        initial_guess: Optional[NDArray[np.float64]] = None,
     ) -> CableFemResult:
         if _IMPORT_ERROR is not None:
             raise ModuleNotFoundError(
@@ -140,85 +194,31 @@ class CableFemAnalyzer:
             [0.0 for _ in range(nx - 1)] for _ in range(ny - 1)
         ]
 
-        mesh_tri, triangle_to_cell = _build_triangular_mesh(x_nodes_mm, y_nodes_mm)
-        basis = Basis(mesh_tri, ElementTriP1())
-        nqp = basis.X.shape[-1]
-
-        tri_conductivity = conductivity_cells.reshape(-1)[triangle_to_cell]
-        conductivity_field = DiscreteField(
-            np.broadcast_to(tri_conductivity[:, None], (mesh_tri.t.shape[1], nqp))
+        system = self._assembled_system(
+            mesh,
+            x_nodes_mm,
+            y_nodes_mm,
+            conductivity_cells,
+            surface_convection_w_per_m2k,
         )
-        stiffness_matrix = asm(_diffusion_form, basis, k=conductivity_field).tocsr()
-
+        mesh_tri = system.mesh_tri
+        triangle_to_cell = system.triangle_to_cell
+        basis = system.basis
+        nqp = basis.X.shape[-1]
+        stiffness_matrix = system.stiffness_matrix
+        stiffness_csc = system.stiffness_csc
+        direct_solver = system.direct_solver
+        preconditioner = system.preconditioner
         total_nodes = nx * ny
-        robin_load = np.zeros(total_nodes, dtype=float)
-        if surface_convection_w_per_m2k > 0.0:
-            convection = float(surface_convection_w_per_m2k)
-            x_nodes_m = x_nodes_mm / 1000.0
-            stiffness_matrix = stiffness_matrix.tolil()
-            for i in range(nx - 1):
-                edge_length = abs(x_nodes_m[i + 1] - x_nodes_m[i])
-                if edge_length <= 0.0:
-                    continue
-                left_node = i * ny
-                right_node = (i + 1) * ny
-                coeff = convection * edge_length / 6.0
-                stiffness_matrix[left_node, left_node] += 2.0 * coeff
-                stiffness_matrix[right_node, right_node] += 2.0 * coeff
-                stiffness_matrix[left_node, right_node] += coeff
-                stiffness_matrix[right_node, left_node] += coeff
-                load = convection * ambient_temp_c * edge_length / 2.0
-                robin_load[left_node] += load
-                robin_load[right_node] += load
-            stiffness_matrix = stiffness_matrix.tocsr()
-        else:
-            stiffness_matrix = stiffness_matrix.tocsr()
-
-        stiffness_csc = stiffness_matrix.tocsc()
-
-        direct_solver: Optional[Callable[[NDArray[np.float64]], NDArray[np.float64]]] = None
-        if (
-            self._prefer_direct
-            and "factorized" in globals()
-            and stiffness_matrix.shape[0] <= self._direct_threshold
-        ):
-            try:
-                factor = factorized(stiffness_csc)
-            except Exception:
-                factor = None
-            if factor is not None:
-                direct_solver = factor
-            else:
-                try:
-                    lu = splu(stiffness_csc)
-                except Exception:
-                    lu = None
-                if lu is not None:
-                    def _lu_solve(vector: NDArray[np.float64]) -> NDArray[np.float64]:
-                        return lu.solve(vector)
-                    direct_solver = _lu_solve
-                else:
-                    if self._prefer_direct:
-                        def _spsolve_solver(vector: NDArray[np.float64]) -> NDArray[np.float64]:
-                            return spsolve(stiffness_csc, vector)
-                        direct_solver = _spsolve_solver
-
-        preconditioner: Optional[LinearOperator] = None
-        if direct_solver is None:
-            try:
-                ilu = spilu(stiffness_csc, drop_tol=1e-3, fill_factor=6)
-            except Exception:  # pragma: no cover - preconditioner is optional
-                ilu = None
-            if ilu is not None:
-                def _ilu_solve(vector: NDArray[np.float64]) -> NDArray[np.float64]:
-                    return ilu.solve(vector)
-                preconditioner = LinearOperator(
-                    stiffness_matrix.shape,
-                    matvec=_ilu_solve,
-                    dtype=stiffness_matrix.dtype,
-                )
+        robin_load = system.robin_unit_load * ambient_temp_c
 
         prior_solution: Optional[NDArray[np.float64]] = None
+        if initial_guess is not None:
+            guess = np.asarray(initial_guess, dtype=float)
+            if guess.shape != (ny, nx):
+                raise ValueError("Initial temperature guess dimensions do not match the mesh.")
+            # Solution vectors are ordered x-major (node = i * ny + j).
+            prior_solution = np.ascontiguousarray(guess.T).reshape(-1)
         total_iterations = 0
         outer_converged = False
         solver_converged = True
@@ -354,6 +354,127 @@ class CableFemAnalyzer:
             bottom_flux_w_per_m=bottom_flux,
         )
 
+    def _assembled_system(
+        self,
+        mesh: StructuredMesh,
+        x_nodes_mm: NDArray[np.float64],
+        y_nodes_mm: NDArray[np.float64],
+        conductivity_cells: NDArray[np.float64],
+        surface_convection_w_per_m2k: float,
+    ) -> _AssembledSystem:
+        """Return the stiffness system for ``mesh``, reusing the last factorisation when unchanged.
+
+        Heat sources and ambient temperature only enter the right-hand side, so
+        repeated solves on the same mesh and surface convection skip assembly
+        and factorisation entirely.
+        """
+        cached = self._system_cache
+        if (
+            cached is not None
+            and cached.mesh is mesh
+            and cached.surface_convection_w_per_m2k == surface_convection_w_per_m2k
+            and cached.prefer_direct == self._prefer_direct
+            and cached.direct_threshold == self._direct_threshold
+        ):
+            return cached
+
+        mesh_tri, triangle_to_cell = _build_triangular_mesh(x_nodes_mm, y_nodes_mm)
+        basis = Basis(mesh_tri, ElementTriP1())
+        nqp = basis.X.shape[-1]
+
+        tri_conductivity = conductivity_cells.reshape(-1)[triangle_to_cell]
+        conductivity_field = DiscreteField(
+            np.broadcast_to(tri_conductivity[:, None], (mesh_tri.t.shape[1], nqp))
+        )
+        stiffness_matrix = asm(_diffusion_form, basis, k=conductivity_field).tocsr()
+
+        nx = x_nodes_mm.size
+        ny = y_nodes_mm.size
+        total_nodes = nx * ny
+        robin_unit_load = np.zeros(total_nodes, dtype=float)
+        if surface_convection_w_per_m2k > 0.0:
+            convection = float(surface_convection_w_per_m2k)
+            x_nodes_m = x_nodes_mm / 1000.0
+            stiffness_matrix = stiffness_matrix.tolil()
+            for i in range(nx - 1):
+                edge_length = abs(x_nodes_m[i + 1] - x_nodes_m[i])
+                if edge_length <= 0.0:
+                    continue
+                left_node = i * ny
+                right_node = (i + 1) * ny
+                coeff = convection * edge_length / 6.0
+                stiffness_matrix[left_node, left_node] += 2.0 * coeff
+                stiffness_matrix[right_node, right_node] += 2.0 * coeff
+                stiffness_matrix[left_node, right_node] += coeff
+                stiffness_matrix[right_node, left_node] += coeff
+                load = convection * edge_length / 2.0
+                robin_unit_load[left_node] += load
+                robin_unit_load[right_node] += load
+            stiffness_matrix = stiffness_matrix.tocsr()
+        else:
+            stiffness_matrix = stiffness_matrix.tocsr()
+
+        stiffness_csc = stiffness_matrix.tocsc()
+
+        direct_solver: Optional[Callable[[NDArray[np.float64]], NDArray[np.float64]]] = None
+        if (
+            self._prefer_direct
+            and "factorized" in globals()
+            and stiffness_matrix.shape[0] <= self._direct_threshold
+        ):
+            try:
+                factor = factorized(stiffness_csc)
+            except Exception:
+                factor = None
+            if factor is not None:
+                direct_solver = factor
+            else:
+                try:
+                    lu = splu(stiffness_csc)
+                except Exception:
+                    lu = None
+                if lu is not None:
+                    def _lu_solve(vector: NDArray[np.float64]) -> NDArray[np.float64]:
+                        return lu.solve(vector)
+                    direct_solver = _lu_solve
+                else:
+                    if self._prefer_direct:
+                        def _spsolve_solver(vector: NDArray[np.float64]) -> NDArray[np.float64]:
+                            return spsolve(stiffness_csc, vector)
+                        direct_solver = _spsolve_solver
+
+        preconditioner: Optional[LinearOperator] = None
+        if direct_solver is None:
+            try:
+                ilu = spilu(stiffness_csc, drop_tol=1e-3, fill_factor=6)
+            except Exception:  # pragma: no cover - preconditioner is optional
+                ilu = None
+            if ilu is not None:
+                def _ilu_solve(vector: NDArray[np.float64]) -> NDArray[np.float64]:
+                    return ilu.solve(vector)
+                preconditioner = LinearOperator(
+                    stiffness_matrix.shape,
+                    matvec=_ilu_solve,
+                    dtype=stiffness_matrix.dtype,
+                )
+
+        system = _AssembledSystem(
+            mesh=mesh,
+            surface_convection_w_per_m2k=surface_convection_w_per_m2k,
+            prefer_direct=self._prefer_direct,
+            direct_threshold=self._direct_threshold,
+            mesh_tri=mesh_tri,
+            triangle_to_cell=triangle_to_cell,
+            basis=basis,
+            stiffness_matrix=stiffness_matrix,
+            stiffness_csc=stiffness_csc,
+            robin_unit_load=robin_unit_load,
+            direct_solver=direct_solver,
+            preconditioner=preconditioner,
+        )
+        self._system_cache = system
+        return system
+
 
 def _update_heat_values(
     heat_values: List[float],
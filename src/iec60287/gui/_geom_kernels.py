@@ -0,0 +1,74 @@
+"""Numeric kernels behind the placement collision checks.
+
+Numba is optional. When it is installed the scalar-loop kernels are compiled to machine
+code (cached on disk), which beats NumPy broadcasting for the handful of circles a
+system has; otherwise the NumPy implementations are used.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:  # pragma: no cover - optional accelerator
+    from numba import njit
+except ModuleNotFoundError:  # pragma: no cover - NumPy fallback below
+    njit = None
+
+
+def _any_overlap_numpy(
+    centres: NDArray[np.float64],
+    radii: NDArray[np.float64],
+    other_centres: NDArray[np.float64],
+    other_radii: NDArray[np.float64],
+    clearance: float,
+) -> bool:
+    dx = centres[:, 0, None] - other_centres[None, :, 0]
+    dy = centres[:, 1, None] - other_centres[None, :, 1]
+    radius_sum = radii[:, None] + other_radii[None, :] + clearance
+    return bool(np.any(dx * dx + dy * dy < radius_sum * radius_sum))
+
+
+def _within_bounds_numpy(
+    centres: NDArray[np.float64],
+    radii: NDArray[np.float64],
+    left: float,
+    right: float,
+    top: float,
+    bottom: float,
+) -> bool:
+    x = centres[:, 0]
+    y = centres[:, 1]
+    return bool(np.all((x - radii >= left) & (x + radii <= right) & (y - radii >= top) & (y + radii <= bottom)))
+
+
+def _any_overlap_loop(centres, radii, other_centres, other_radii, clearance):  # pragma: no cover - compiled
+    for i in range(centres.shape[0]):
+        x = centres[i, 0]
+        y = centres[i, 1]
+        r = radii[i] + clearance
+        for j in range(other_centres.shape[0]):
+            dx = x - other_centres[j, 0]
+            dy = y - other_centres[j, 1]
+            limit = r + other_radii[j]
+            if dx * dx + dy * dy < limit * limit:
+                return True
+    return False
+
+
+def _within_bounds_loop(centres, radii, left, right, top, bottom):  # pragma: no cover - compiled
+    for i in range(centres.shape[0]):
+        r = radii[i]
+        if centres[i, 0] - r < left or centres[i, 0] + r > right:
+            return False
+        if centres[i, 1] - r < top or centres[i, 1] + r > bottom:
+            return False
+    return True
+
+
+if njit is not None:  # pragma: no cover - depends on the optional dependency
+    any_overlap = njit(cache=True)(_any_overlap_loop)
+    within_bounds = njit(cache=True)(_within_bounds_loop)
+else:
+    any_overlap = _any_overlap_numpy
+    within_bounds = _within_bounds_numpy
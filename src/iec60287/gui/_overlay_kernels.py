@@ -0,0 +1,72 @@
+"""Numeric kernel behind the temperature overlay colours.
+
+Numba is optional. When it is installed the per-cell loop is compiled (cached on disk and
+parallel over rows), fusing the corner averaging and the colour lookup into one pass over
+the mesh; otherwise the NumPy implementation is used.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:  # pragma: no cover - optional accelerator
+    from numba import njit, prange
+except ModuleNotFoundError:  # pragma: no cover - NumPy fallback below
+    njit = None
+    prange = range
+
+
+def _cell_colours_numpy(
+    temps: NDArray[np.float64],
+    min_temp: float,
+    span: float,
+    fallback: float,
+    lut: NDArray[np.uint32],
+) -> NDArray[np.uint32]:
+    # Mean of the finite corner samples per cell, falling back to ``fallback``.
+    corners = np.stack((temps[:-1, :-1], temps[:-1, 1:], temps[1:, :-1], temps[1:, 1:]))
+    corner_ok = np.isfinite(corners)
+    counts = corner_ok.sum(axis=0)
+    totals = np.where(corner_ok, corners, 0.0).sum(axis=0)
+    averages = np.where(counts > 0, totals / np.maximum(counts, 1), fallback)
+
+    if span <= 1e-6:
+        fractions = np.full_like(averages, 0.5)
+    else:
+        fractions = np.clip((averages - min_temp) / span, 0.0, 1.0)
+    indices = np.rint(fractions * (lut.shape[0] - 1)).astype(np.intp)
+    return lut[indices]
+
+
+def _cell_colours_loop(temps, min_temp, span, fallback, lut):  # pragma: no cover - compiled
+    rows = temps.shape[0] - 1
+    columns = temps.shape[1] - 1
+    top = lut.shape[0] - 1
+    out = np.empty((rows, columns), dtype=np.uint32)
+    for row in prange(rows):
+        for column in range(columns):
+            total = 0.0
+            count = 0
+            for value in (
+                temps[row, column],
+                temps[row, column + 1],
+                temps[row + 1, column],
+                temps[row + 1, column + 1],
+            ):
+                if np.isfinite(value):
+                    total += value
+                    count += 1
+            average = total / count if count > 0 else fallback
+            if span <= 1e-6:
+                fraction = 0.5
+            else:
+                fraction = min(max((average - min_temp) / span, 0.0), 1.0)
+            out[row, column] = lut[int(np.rint(fraction * top))]
+    return out
+
+
+if njit is not None:  # pragma: no cover - depends on the optional dependency
+    overlay_cell_colours = njit(cache=True, parallel=True)(_cell_colours_loop)
+else:
+    overlay_cell_colours = _cell_colours_numpy
@@ -1,13 +1,28 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import replace
 from datetime import datetime
 from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
-
-from PySide6.QtCore import Qt, QObject, QThread, Signal, Slot
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QSignalBlocker,
+    QThread,
+    QTimer,
+    Qt,
+    Signal,
+    Slot,
+)
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QCheckBox,
     QDoubleSpinBox,
     QFormLayout,
@@ -18,8 +33,9 @@ from PySide6.QtWidgets import (
     QPushButton,
     QProgressBar,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -27,6 +43,7 @@ from PySide6.QtWidgets import (
 from iec60287.fem import (
     CableFemAnalyzer,
     CableFemResult,
+    CableTemperature,
     MeshBuildOutput,
     MeshCableDefinition,
     CableLoad,
@@ -42,6 +59,8 @@ class FemWorker(QObject):
     finished = Signal(CableFemResult)
     error = Signal(str)
 
+    _PREVIEW_PROGRESS_SHARE = 0.2
+
     def __init__(
         self,
         mesh_output: MeshBuildOutput,
@@ -52,48 +71,264 @@ class FemWorker(QObject):
         max_iterations: int,
         tolerance_c: float,
         simplified_constant_rho: bool,
+        preview_mesh_output: Optional[MeshBuildOutput] = None,
+        analyzer: Optional[CableFemAnalyzer] = None,
+        preview_analyzer: Optional[CableFemAnalyzer] = None,
     ) -> None:
         super().__init__()
         self._mesh_output = mesh_output
+        self._preview_mesh_output = preview_mesh_output
         self._loads = list(loads)
         self._ambient_temp_c = ambient_temp_c
         self._surface_convection = max(surface_convection_w_per_m2k, 0.0)
         self._max_iterations = max_iterations
         self._tolerance_c = tolerance_c
         self._simplified_constant_rho = simplified_constant_rho
+        self._analyzer = analyzer or CableFemAnalyzer()
+        self._preview_analyzer = preview_analyzer or CableFemAnalyzer()
 
     @Slot()
     def run(self) -> None:
-        analyzer = CableFemAnalyzer(
-            max_iterations=self._max_iterations,
-            tolerance_c=self._tolerance_c,
-        )
+        analyzer = self._analyzer
+        analyzer.configure(max_iterations=self._max_iterations, tolerance_c=self._tolerance_c)
         try:
+            loads = self._loads
+            initial_guess: Optional[NDArray[np.float64]] = None
+            progress_start = 0.0
+            if self._preview_mesh_output is not None:
+                warm_start = self._solve_preview()
+                if warm_start is not None:
+                    initial_guess, loads = warm_start
+                    progress_start = self._PREVIEW_PROGRESS_SHARE
             result = analyzer.solve(
                 self._mesh_output.mesh,
-                self._loads,
+                loads,
                 ambient_temp_c=self._ambient_temp_c,
                 surface_convection_w_per_m2k=self._surface_convection,
-                progress_callback=self._handle_progress,
+                progress_callback=partial(self._handle_scaled_progress, progress_start, 1.0),
                 simplified_constant_rho=self._simplified_constant_rho,
+                initial_guess=initial_guess,
             )
         except Exception as exc:  # noqa: BLE001
             self.error.emit(str(exc))
             return
         self.finished.emit(result)
 
+    def _solve_preview(self) -> Optional[Tuple[Optional[NDArray[np.float64]], List[CableLoad]]]:
+        """Solve the coarse preview mesh loosely and return a warm start for the fine solve.
+
+        The converged heats always seed the auto-updated loads; the resampled field is only
+        returned when the fine mesh is solved iteratively, as a direct solve has no use for it.
+        """
+        preview = self._preview_mesh_output
+        if preview is None:
+            return None
+        coarse_lookup = {cable.label: cable for cable in preview.cables}
+        coarse_loads: List[CableLoad] = []
+        for load in self._loads:
+            definition = coarse_lookup.get(load.definition.label)
+            if definition is None:
+                return None
+            coarse_loads.append(replace(load, definition=definition))
+
+        coarse_analyzer = self._preview_analyzer
+        coarse_analyzer.configure(
+            max_iterations=max(1, self._max_iterations // 4),
+            tolerance_c=self._tolerance_c * 10.0,
+        )
+        coarse = coarse_analyzer.solve(
+            preview.mesh,
+            coarse_loads,
+            ambient_temp_c=self._ambient_temp_c,
+            surface_convection_w_per_m2k=self._surface_convection,
+            progress_callback=partial(self._handle_scaled_progress, 0.0, self._PREVIEW_PROGRESS_SHARE),
+            simplified_constant_rho=self._simplified_constant_rho,
+        )
+        mesh = self._mesh_output.mesh
+        initial_guess: Optional[NDArray[np.float64]] = None
+        if not self._analyzer.solves_directly(mesh, surface_convection_w_per_m2k=self._surface_convection):
+            initial_guess = _resample_temperature_field(coarse, mesh.x_nodes_mm, mesh.y_nodes_mm)
+        warm_loads = [
+            replace(load, heat_w_per_m=heat) if load.auto_update else load
+            for load, heat in zip(self._loads, coarse.heat_w_per_m)
+        ]
+        return initial_guess, warm_loads
+
+    def _handle_scaled_progress(self, start: float, end: float, value: float) -> None:
+        self._handle_progress(start + (end - start) * value)
+
     def _handle_progress(self, value: float) -> None:
         self.progress.emit(max(0.0, min(1.0, value)))
 
 
-@dataclass
-class FemCableEntry:
-    label: str
-    x_mm: float
-    y_mm: float
-    radius_mm: float
-    heat_w_per_m: float
-    auto_heat: bool
+class _Entries:
+    """Struct-of-arrays store for the cable rows shown in the FEM panel."""
+
+    __slots__ = ("labels", "x_mm", "y_mm", "radius_mm", "heat_w_per_m", "auto_heat")
+
+    def __init__(
+        self,
+        labels: Sequence[str] = (),
+        x_mm: Optional[NDArray[np.float64]] = None,
+        y_mm: Optional[NDArray[np.float64]] = None,
+        radius_mm: Optional[NDArray[np.float64]] = None,
+        heat_w_per_m: Optional[NDArray[np.float64]] = None,
+        auto_heat: Optional[NDArray[np.bool_]] = None,
+    ) -> None:
+        count = len(labels)
+        self.labels: List[str] = list(labels)
+        self.x_mm = x_mm if x_mm is not None else np.zeros(count)
+        self.y_mm = y_mm if y_mm is not None else np.zeros(count)
+        self.radius_mm = radius_mm if radius_mm is not None else np.zeros(count)
+        self.heat_w_per_m = heat_w_per_m if heat_w_per_m is not None else np.zeros(count)
+        self.auto_heat = auto_heat if auto_heat is not None else np.zeros(count, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+
+class _CableTableModel(QAbstractTableModel):
+    """Table model exposing FEM cable entries; the heat column is editable."""
+
+    HEAT_COLUMN = 4
+
+    # Emitted after a heat edit has been stored, so the owner can record it as a user override.
+    heatEdited = Signal(str, float)
+
+    def __init__(self, headers: Sequence[str], parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._entries = _Entries()
+
+    def set_entries(self, entries: _Entries) -> None:
+        self.beginResetModel()
+        self._entries = entries
+        self.endResetModel()
+
+    def refresh_all_heat(self) -> None:
+        if not self._entries:
+            return
+        self.dataChanged.emit(
+            self.index(0, self.HEAT_COLUMN),
+            self.index(len(self._entries) - 1, self.HEAT_COLUMN),
+        )
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        entries = self._entries
+        row = index.row()
+        column = index.column()
+        if column == self.HEAT_COLUMN:
+            if role == Qt.DisplayRole:
+                return f"{entries.heat_w_per_m[row]:.1f}"
+            if role == Qt.EditRole:
+                return float(entries.heat_w_per_m[row])
+            if role == Qt.ToolTipRole:
+                return "Auto-calculated from operating current" if entries.auto_heat[row] else "Manual override"
+            return None
+        if role != Qt.DisplayRole:
+            return None
+        if column == 0:
+            return entries.labels[row]
+        if column == 1:
+            return f"{entries.radius_mm[row]:.1f}"
+        if column == 2:
+            return f"{entries.x_mm[row]:.1f}"
+        if column == 3:
+            return f"{entries.y_mm[row]:.1f}"
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == self.HEAT_COLUMN:
+            return Qt.ItemIsEnabled | Qt.ItemIsEditable
+        return Qt.ItemIsEnabled
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if role != Qt.EditRole or not index.isValid() or index.column() != self.HEAT_COLUMN:
+            return False
+        row = index.row()
+        heat = float(value)
+        self._entries.heat_w_per_m[row] = heat
+        self._entries.auto_heat[row] = False
+        self.dataChanged.emit(index, index)
+        self.heatEdited.emit(self._entries.labels[row], heat)
+        return True
+
+
+class _ResultTableModel(QAbstractTableModel):
+    """Read-only table model over per-cable FEM temperature summaries."""
+
+    def __init__(self, headers: Sequence[str], parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._temperatures: Sequence[CableTemperature] = ()
+
+    def set_temperatures(self, temperatures: Sequence[CableTemperature]) -> None:
+        self.beginResetModel()
+        self._temperatures = temperatures
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._temperatures)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        temp = self._temperatures[index.row()]
+        column = index.column()
+        if column == 0:
+            return temp.label
+        if column == 1:
+            return f"{temp.max_temp_c:.2f}"
+        if column == 2:
+            return f"{temp.average_temp_c:.2f}"
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        return Qt.ItemIsEnabled if index.isValid() else Qt.NoItemFlags
+
+
+class _HeatSpinDelegate(QStyledItemDelegate):
+    """Edits heat values with a transient spin box instead of one widget per row."""
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> QWidget:
+        spin = QDoubleSpinBox(parent)
+        spin.setRange(0.0, 5000.0)
+        spin.setDecimals(1)
+        spin.setSingleStep(10.0)
+        spin.setFrame(False)
+        return spin
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex) -> None:
+        if isinstance(editor, QDoubleSpinBox):
+            editor.setValue(float(index.data(Qt.EditRole) or 0.0))
+
+    def setModelData(self, editor: QWidget, model: QAbstractTableModel, index: QModelIndex) -> None:
+        if isinstance(editor, QDoubleSpinBox):
+            editor.interpretText()
+            model.setData(index, editor.value(), Qt.EditRole)
 
 
 class CableFEMPanel(QWidget):
@@ -101,15 +336,21 @@ class CableFEMPanel(QWidget):
 
     _TABLE_HEADERS = ["Cable", "Radius (mm)", "X (mm)", "Y (mm)", "Heat (W/m)"]
     _RESULT_HEADERS = ["Cable", "Max Temp (°C)", "Avg Temp (°C)"]
+    _MESH_CACHE_SIZE = 4
+    _REFRESH_DELAY_MS = 50
 
     def __init__(self, scene: PlacementScene, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._scene = scene
-        self._entries: List[FemCableEntry] = []
+        self._entries = _Entries()
+        # Set once a run writes converged heats into auto rows; a refresh then restores estimates.
+        self._entries_have_solver_heats = False
         self._user_heat_overrides: Dict[str, float] = {}
         self._soil_user_override = False
-        self._missing_current_labels: List[str] = []
+        self._missing_current_labels: Set[str] = set()
         self._mesh_output: Optional[MeshBuildOutput] = None
+        self._mesh_cache: "OrderedDict[Tuple[object, ...], MeshBuildOutput]" = OrderedDict()
+        self._heat_estimate_cache: Optional[Tuple[MeshBuildOutput, float, NDArray[np.float64]]] = None
 
         self._ambient_spin = QDoubleSpinBox(self)
         self._soil_resistivity_spin = QDoubleSpinBox(self)
@@ -120,9 +361,12 @@ class CableFEMPanel(QWidget):
         self._surface_convection_spin = QDoubleSpinBox(self)
         self._growth_ratio_spin = QDoubleSpinBox(self)
         self._simplified_checkbox = QCheckBox("Simplified FEM (constant ρ @ 90°C)", self)
+        self._preview_checkbox = QCheckBox("Fast preview (coarse warm start)", self)
 
-        self._cable_table = QTableWidget(self)
-        self._result_table = QTableWidget(self)
+        self._cable_model = _CableTableModel(self._TABLE_HEADERS, self)
+        self._result_model = _ResultTableModel(self._RESULT_HEADERS, self)
+        self._cable_table = QTableView(self)
+        self._result_table = QTableView(self)
         self._status_label = QLabel(self)
         self._refresh_button = QPushButton("Refresh from Scene", self)
         self._run_button = QPushButton("Run FEM Analysis", self)
@@ -133,7 +377,20 @@ class CableFEMPanel(QWidget):
 
         self._worker_thread: Optional[QThread] = None
         self._worker: Optional[FemWorker] = None
+        # Kept across runs so unchanged meshes reuse their assembled/factorised system.
+        self._analyzer = CableFemAnalyzer()
+        self._preview_analyzer = CableFemAnalyzer()
+
+        self._pending_force_refresh = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self._REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self.refresh_from_scene)
         self._pending_loads: List[CableLoad] = []
+        self._pending_mesh_output: Optional[MeshBuildOutput] = None
+        # Solver-converged auto heats of the last completed run, keyed by cable label; they seed
+        # the auto-updated loads of the next run on the same mesh.
+        self._last_heats: Optional[Tuple[MeshBuildOutput, Dict[str, float]]] = None
         self._report_root = Path.cwd() / "fem_reports"
         self._latest_report: Optional[ReportPaths] = None
         self._report_root.mkdir(parents=True, exist_ok=True)
@@ -220,6 +477,11 @@ class CableFEMPanel(QWidget):
         form.addRow("Max iterations", self._max_iterations_spin)
         form.addRow("Convergence tolerance", self._tolerance_spin)
         form.addRow("Solver mode", self._simplified_checkbox)
+        self._preview_checkbox.setToolTip(
+            "Solve a 2× coarser grid first and use its converged cable heats as the starting "
+            "point for the auto-calculated heats of the full solve."
+        )
+        form.addRow("Warm start", self._preview_checkbox)
         return group
 
     def _build_cable_group(self) -> QGroupBox:
@@ -228,13 +490,15 @@ class CableFEMPanel(QWidget):
         layout.setContentsMargins(6, 6, 6, 6)
         layout.setSpacing(6)
 
-        self._cable_table.setColumnCount(len(self._TABLE_HEADERS))
-        self._cable_table.setHorizontalHeaderLabels(self._TABLE_HEADERS)
+        self._cable_table.setModel(self._cable_model)
+        self._cable_table.setItemDelegateForColumn(
+            _CableTableModel.HEAT_COLUMN,
+            _HeatSpinDelegate(self._cable_table),
+        )
         self._cable_table.verticalHeader().setVisible(False)
         self._cable_table.setAlternatingRowColors(True)
-        self._cable_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self._cable_table.setFocusPolicy(Qt.NoFocus)
-        self._cable_table.setSelectionMode(QTableWidget.NoSelection)
+        self._cable_table.setEditTriggers(QAbstractItemView.AllEditTriggers)
+        self._cable_table.setSelectionMode(QAbstractItemView.NoSelection)
         self._cable_table.horizontalHeader().setStretchLastSection(True)
         layout.addWidget(self._cable_table)
         return group
@@ -245,12 +509,11 @@ class CableFEMPanel(QWidget):
         layout.setContentsMargins(6, 6, 6, 6)
         layout.setSpacing(6)
 
-        self._result_table.setColumnCount(len(self._RESULT_HEADERS))
-        self._result_table.setHorizontalHeaderLabels(self._RESULT_HEADERS)
+        self._result_table.setModel(self._result_model)
         self._result_table.verticalHeader().setVisible(False)
         self._result_table.setAlternatingRowColors(True)
-        self._result_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self._result_table.setSelectionMode(QTableWidget.NoSelection)
+        self._result_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._result_table.setSelectionMode(QAbstractItemView.NoSelection)
         self._result_table.setFocusPolicy(Qt.NoFocus)
         self._result_table.horizontalHeader().setStretchLastSection(True)
         layout.addWidget(self._result_table)
@@ -260,25 +523,27 @@ class CableFEMPanel(QWidget):
         self._refresh_button.clicked.connect(self.refresh_from_scene)
         self._run_button.clicked.connect(self._handle_run_clicked)
         self._soil_resistivity_spin.valueChanged.connect(self._handle_soil_changed)
+        self._cable_model.heatEdited.connect(self._handle_heat_changed)
 
     # ---------------------------------------------------------------- refresh
+    def schedule_refresh(self, force: bool = False) -> None:
+        """Coalesce bursts of scene changes into a single deferred refresh."""
+        self._pending_force_refresh = self._pending_force_refresh or force
+        self._refresh_timer.start()
+
     def refresh_from_scene(self, force: bool = False) -> None:
+        self._refresh_timer.stop()
+        force = force or self._pending_force_refresh
+        self._pending_force_refresh = False
         try:
-            mesh_output = build_structured_mesh(
-                self._scene,
-                grid_step_mm=self._grid_step_spin.value(),
-                padding_mm=self._padding_spin.value(),
-                max_growth_ratio=self._growth_ratio_spin.value(),
-                default_resistivity_k_m_per_w=self._soil_resistivity_spin.value(),
-            )
+            mesh_output = self._get_or_build_mesh()
         except ValueError as exc:
             self._mesh_output = None
-            self._entries = []
+            self._entries = _Entries()
             self._populate_cable_table()
             self._status_label.setText(f"Unable to build FEM mesh: {exc}")
             return
 
-        self._mesh_output = mesh_output
         self._rebuild_entries(mesh_output, preserve_overrides=not force)
         if force or not self._soil_user_override:
             soil_rho = self._infer_soil_resistivity()
@@ -291,73 +556,86 @@ class CableFEMPanel(QWidget):
             message += " Set operating current in the Cable System Editor to auto-compute heat."
         self._status_label.setText(message)
 
+    def _get_or_build_mesh(self, grid_step_mm: Optional[float] = None) -> MeshBuildOutput:
+        grid_step = self._grid_step_spin.value() if grid_step_mm is None else grid_step_mm
+        padding = self._padding_spin.value()
+        growth_ratio = self._growth_ratio_spin.value()
+        soil_rho = self._soil_resistivity_spin.value()
+        revision = getattr(self._scene, "structure_revision", None)
+        key = (
+            round(grid_step, 2),
+            round(padding, 2),
+            round(growth_ratio, 3),
+            round(soil_rho, 4),
+            revision() if callable(revision) else None,
+        )
+        cacheable = key[-1] is not None
+        cached = self._mesh_cache.get(key) if cacheable else None
+        if cached is not None:
+            self._mesh_cache.move_to_end(key)
+            return cached
+
+        mesh_output = build_structured_mesh(
+            self._scene,
+            grid_step_mm=grid_step,
+            padding_mm=padding,
+            max_growth_ratio=growth_ratio,
+            default_resistivity_k_m_per_w=soil_rho,
+        )
+        if cacheable:
+            self._mesh_cache[key] = mesh_output
+            while len(self._mesh_cache) > self._MESH_CACHE_SIZE:
+                self._mesh_cache.popitem(last=False)
+        return mesh_output
+
     def _rebuild_entries(self, mesh_output: MeshBuildOutput, preserve_overrides: bool) -> None:
-        if not preserve_overrides:
-            self._user_heat_overrides.clear()
-        valid_labels = {cable.label for cable in mesh_output.cables}
-        self._user_heat_overrides = {
-            label: value for label, value in self._user_heat_overrides.items() if label in valid_labels
-        }
-        entries: List[FemCableEntry] = []
-        missing_labels: List[str] = []
-
-        for cable in mesh_output.cables:
-            radius = cable.overall_radius_mm
-            default_heat = self._estimate_heat_from_definition(cable)
-            if default_heat is None:
-                missing_labels.append(cable.label)
-            heat_value = self._user_heat_overrides.get(
-                cable.label,
-                default_heat if default_heat is not None else 0.0,
-            )
-            auto_heat = default_heat is not None and (
-                cable.label not in self._user_heat_overrides
-                or (preserve_overrides and self._user_heat_overrides.get(cable.label) == default_heat)
-            )
-            entries.append(
-                FemCableEntry(
-                    label=cable.label,
-                    x_mm=cable.centre_x_mm,
-                    y_mm=cable.centre_y_mm,
-                    radius_mm=radius,
-                    heat_w_per_m=heat_value,
-                    auto_heat=auto_heat,
-                )
-            )
+        if (
+            preserve_overrides
+            and mesh_output is self._mesh_output
+            and self._entries
+            and not self._entries_have_solver_heats
+        ):
+            # Same cached mesh: entries already carry any edits made since the last rebuild.
+            return
+        self._mesh_output = mesh_output
+        self._entries_have_solver_heats = False
+        if self._last_heats is not None and self._last_heats[0] is not mesh_output:
+            self._last_heats = None
+        previous_overrides = self._user_heat_overrides if preserve_overrides else {}
+        cables = mesh_output.cables
+        count = len(cables)
+        labels = [cable.label for cable in cables]
+        # Keep only overrides for cables that still exist, built in a single pass.
+        user_overrides = {label: previous_overrides[label] for label in labels if label in previous_overrides}
+        self._user_heat_overrides = user_overrides
+        default_heats = self._default_heat_estimates(mesh_output)
+        missing = np.isnan(default_heats)
+        overrides = np.fromiter(
+            (user_overrides.get(label, np.nan) for label in labels),
+            dtype=np.float64,
+            count=count,
+        )
+        has_override = ~np.isnan(overrides)
+        entries = _Entries(
+            labels,
+            x_mm=np.fromiter((cable.centre_x_mm for cable in cables), dtype=np.float64, count=count),
+            y_mm=np.fromiter((cable.centre_y_mm for cable in cables), dtype=np.float64, count=count),
+            radius_mm=np.fromiter((cable.overall_radius_mm for cable in cables), dtype=np.float64, count=count),
+            heat_w_per_m=np.where(has_override, overrides, np.where(missing, 0.0, default_heats)),
+            auto_heat=~missing & (~has_override | (preserve_overrides & (overrides == default_heats))),
+        )
+        missing_labels = {label for label, absent in zip(labels, missing.tolist()) if absent}
 
         self._entries = entries
         self._missing_current_labels = missing_labels
         self._populate_cable_table()
 
     def _populate_cable_table(self) -> None:
-        self._cable_table.setRowCount(len(self._entries))
-
-        for row, entry in enumerate(self._entries):
-            self._set_item(row, 0, entry.label)
-            self._set_item(row, 1, f"{entry.radius_mm:.1f}")
-            self._set_item(row, 2, f"{entry.x_mm:.1f}")
-            self._set_item(row, 3, f"{entry.y_mm:.1f}")
-
-            spin = QDoubleSpinBox(self._cable_table)
-            spin.setRange(0.0, 5000.0)
-            spin.setDecimals(1)
-            spin.setSingleStep(10.0)
-            spin.blockSignals(True)
-            spin.setValue(entry.heat_w_per_m)
-            spin.blockSignals(False)
-            spin.valueChanged.connect(partial(self._handle_heat_changed, row, entry.label))
-            spin.setToolTip(
-                "Auto-calculated from operating current" if entry.auto_heat else "Manual override"
-            )
-            self._cable_table.setCellWidget(row, 4, spin)
-
-        self._cable_table.resizeColumnsToContents()
-        self._cable_table.horizontalHeader().setStretchLastSection(True)
-
-    def _set_item(self, row: int, column: int, text: str) -> None:
-        item = QTableWidgetItem(text)
-        item.setFlags(Qt.ItemIsEnabled)
-        self._cable_table.setItem(row, column, item)
+        previous_rows = self._cable_model.rowCount()
+        with _batched_view_update(self._cable_table):
+            self._cable_model.set_entries(self._entries)
+            if self._cable_model.rowCount() != previous_rows:
+                self._cable_table.resizeColumnsToContents()
 
     # -------------------------------------------------------------- simulation
     def _handle_run_clicked(self) -> None:
@@ -368,32 +646,34 @@ class CableFEMPanel(QWidget):
         self._latest_report = None
 
         try:
-            mesh_output = build_structured_mesh(
-                self._scene,
-                grid_step_mm=self._grid_step_spin.value(),
-                padding_mm=self._padding_spin.value(),
-                max_growth_ratio=self._growth_ratio_spin.value(),
-                default_resistivity_k_m_per_w=self._soil_resistivity_spin.value(),
-            )
+            mesh_output = self._get_or_build_mesh()
         except ValueError as exc:
             QMessageBox.critical(self, "Cable FEM", str(exc))
             return
 
-        self._mesh_output = mesh_output
         self._rebuild_entries(mesh_output, preserve_overrides=True)
 
         definition_lookup = {cable.label: cable for cable in mesh_output.cables}
         loads: List[CableLoad] = []
         simplified = self._simplified_checkbox.isChecked()
-        for entry in self._entries:
-            definition = definition_lookup.get(entry.label)
+        hot_heats: Dict[str, float] = {}
+        if not simplified and self._last_heats is not None and self._last_heats[0] is mesh_output:
+            hot_heats = self._last_heats[1]
+        entries = self._entries
+        for label, heat, auto_heat in zip(
+            entries.labels,
+            np.maximum(entries.heat_w_per_m, 0.0).tolist(),
+            entries.auto_heat.tolist(),
+        ):
+            definition = definition_lookup.get(label)
             if not definition:
                 continue
+            auto_update = auto_heat and not simplified
             loads.append(
                 CableLoad(
                     definition=definition,
-                    heat_w_per_m=max(entry.heat_w_per_m, 0.0),
-                    auto_update=entry.auto_heat and not simplified,
+                    heat_w_per_m=hot_heats.get(label, heat) if auto_update else heat,
+                    auto_update=auto_update,
                 )
             )
 
@@ -401,7 +681,15 @@ class CableFEMPanel(QWidget):
             QMessageBox.information(self, "Cable FEM", "No cables available for analysis.")
             return
 
+        preview_mesh: Optional[MeshBuildOutput] = None
+        if not hot_heats and self._preview_checkbox.isChecked():
+            try:
+                preview_mesh = self._get_or_build_mesh(grid_step_mm=self._grid_step_spin.value() * 2.0)
+            except ValueError:
+                preview_mesh = None
+
         self._pending_loads = loads
+        self._pending_mesh_output = mesh_output
         self._simplified_last_run = simplified
         self._progress_bar.setValue(0)
         self._progress_bar.setVisible(True)
@@ -410,6 +698,8 @@ class CableFEMPanel(QWidget):
         status_msg = "Running FEM analysis..."
         if simplified:
             status_msg += " (simplified constant ρ)"
+        if preview_mesh is not None:
+            status_msg += " (coarse warm start)"
         self._status_label.setText(status_msg)
 
         self._worker_thread = QThread(self)
@@ -421,6 +711,9 @@ class CableFEMPanel(QWidget):
             max_iterations=self._max_iterations_spin.value(),
             tolerance_c=self._tolerance_spin.value(),
             simplified_constant_rho=simplified,
+            preview_mesh_output=preview_mesh,
+            analyzer=self._analyzer,
+            preview_analyzer=self._preview_analyzer,
         )
         self._worker.moveToThread(self._worker_thread)
         self._worker_thread.started.connect(self._worker.run)
@@ -433,11 +726,8 @@ class CableFEMPanel(QWidget):
         self._worker_thread.start()
 
     def _populate_results(self, result: CableFemResult) -> None:
-        self._result_table.setRowCount(len(result.cable_temperatures))
-        for row, temp in enumerate(result.cable_temperatures):
-            self._set_result_item(row, 0, temp.label)
-            self._set_result_item(row, 1, f"{temp.max_temp_c:.2f}")
-            self._set_result_item(row, 2, f"{temp.average_temp_c:.2f}")
+        with _batched_view_update(self._result_table):
+            self._result_model.set_temperatures(result.cable_temperatures)
 
         mode_note = " (simplified constant ρ)" if self._simplified_last_run else ""
         info = (
@@ -452,11 +742,6 @@ class CableFEMPanel(QWidget):
         info += flux_info
         self._status_label.setText(info)
 
-    def _set_result_item(self, row: int, column: int, text: str) -> None:
-        item = QTableWidgetItem(text)
-        item.setFlags(Qt.ItemIsEnabled)
-        self._result_table.setItem(row, column, item)
-
     def _apply_solver_heat_updates(self, result: CableFemResult, loads: Sequence[CableLoad]) -> None:
         if not loads or self._simplified_last_run:
             return
@@ -464,19 +749,13 @@ class CableFEMPanel(QWidget):
             load.definition.label: heat
             for load, heat in zip(loads, result.heat_w_per_m)
         }
-        for row, entry in enumerate(self._entries):
-            if not entry.auto_heat:
-                continue
-            new_heat = heat_map.get(entry.label)
-            if new_heat is None:
-                continue
-            entry.heat_w_per_m = new_heat
-            widget = self._cable_table.cellWidget(row, 4)
-            if isinstance(widget, QDoubleSpinBox):
-                widget.blockSignals(True)
-                widget.setValue(new_heat)
-                widget.blockSignals(False)
-                widget.setToolTip("Auto-calculated from operating current")
+        entries = self._entries
+        for row in np.flatnonzero(entries.auto_heat).tolist():
+            new_heat = heat_map.get(entries.labels[row])
+            if new_heat is not None:
+                entries.heat_w_per_m[row] = new_heat
+                self._entries_have_solver_heats = True
+        self._cable_model.refresh_all_heat()
 
     def _on_worker_progress(self, value: float) -> None:
         maximum = self._progress_bar.maximum() or 1000
@@ -485,6 +764,17 @@ class CableFEMPanel(QWidget):
     def _on_worker_finished(self, result: CableFemResult) -> None:
         loads = list(self._pending_loads)
         self._pending_loads.clear()
+        solved_mesh = self._pending_mesh_output
+        self._pending_mesh_output = None
+        if solved_mesh is not None and solved_mesh is self._mesh_output and not self._simplified_last_run:
+            self._last_heats = (
+                solved_mesh,
+                {
+                    load.definition.label: heat
+                    for load, heat in zip(loads, result.heat_w_per_m)
+                    if load.auto_update
+                },
+            )
         self._progress_bar.setValue(self._progress_bar.maximum())
         self._progress_bar.setVisible(False)
         self._run_button.setEnabled(True)
@@ -515,6 +805,7 @@ class CableFEMPanel(QWidget):
 
     def _on_worker_error(self, message: str) -> None:
         self._pending_loads.clear()
+        self._pending_mesh_output = None
         self._progress_bar.setVisible(False)
         self._run_button.setEnabled(True)
         self._refresh_button.setEnabled(True)
@@ -547,45 +838,88 @@ class CableFEMPanel(QWidget):
             return None
         return max(layers[0].thermal_resistivity_k_m_per_w, 0.05)
 
-    def _handle_heat_changed(self, row: int, label: str, value: float) -> None:
-        if 0 <= row < len(self._entries):
-            entry = self._entries[row]
-            entry.heat_w_per_m = value
-            entry.auto_heat = False
-            self._user_heat_overrides[label] = value
-            widget = self._cable_table.cellWidget(row, 4)
-            if isinstance(widget, QDoubleSpinBox):
-                widget.setToolTip("Manual override")
-        else:
-            self._user_heat_overrides[label] = value
+    def _handle_heat_changed(self, label: str, value: float) -> None:
+        self._user_heat_overrides[label] = value
 
     def _handle_soil_changed(self, _: float) -> None:
         self._soil_user_override = True
 
     # ----------------------------------------------------------- estimations
-    def _estimate_heat_from_definition(self, cable: MeshCableDefinition) -> Optional[float]:
-        current = cable.nominal_current_a
-        if current is None or current <= 0.0:
-            return None
-        resistance = self._conductor_resistance_from_definition(cable, temperature_c=self._target_conductor_temp())
-        if resistance is None:
-            return None
-        return (current ** 2) * resistance
-
-    def _conductor_resistance_from_definition(
-        self,
-        cable: MeshCableDefinition,
-        *,
-        temperature_c: float,
-    ) -> Optional[float]:
-        area = max(cable.conductor_area_mm2, 0.0)
-        resistivity = cable.conductor_resistivity_ohm_mm2_per_m
-        if area <= 0.0 or resistivity is None or resistivity <= 0.0:
-            return None
-        alpha = cable.conductor_temp_coefficient_per_c or 0.0
-        rho_theta = resistivity * (1.0 + alpha * (temperature_c - 20.0))
-        resistance = rho_theta / area
-        return resistance if resistance > 0.0 else None
+    def _default_heat_estimates(self, mesh_output: MeshBuildOutput) -> NDArray[np.float64]:
+        temperature_c = self._target_conductor_temp()
+        cached = self._heat_estimate_cache
+        if cached is not None and cached[0] is mesh_output and cached[1] == temperature_c:
+            return cached[2]
+        estimates = _estimate_heat_values(mesh_output.cables, temperature_c)
+        self._heat_estimate_cache = (mesh_output, temperature_c, estimates)
+        return estimates
 
     def _target_conductor_temp(self) -> float:
         return 90.0
+
+
+@contextmanager
+def _batched_view_update(view: QTableView) -> Iterator[None]:
+    """Suspend repaints and view signals while a table's model is reset."""
+    view.setUpdatesEnabled(False)
+    try:
+        with QSignalBlocker(view):
+            yield
+    finally:
+        view.setUpdatesEnabled(True)
+
+
+def _estimate_heat_values(
+    cables: Sequence[MeshCableDefinition],
+    temperature_c: float,
+) -> NDArray[np.float64]:
+    """Return I²R heat (W/m) per cable, NaN where current or conductor data is missing."""
+    count = len(cables)
+    nan = float("nan")
+    currents = np.fromiter(
+        (nan if cable.nominal_current_a is None else cable.nominal_current_a for cable in cables),
+        dtype=np.float64,
+        count=count,
+    )
+    areas = np.fromiter((cable.conductor_area_mm2 for cable in cables), dtype=np.float64, count=count)
+    resistivities = np.fromiter(
+        (
+            nan if cable.conductor_resistivity_ohm_mm2_per_m is None else cable.conductor_resistivity_ohm_mm2_per_m
+            for cable in cables
+        ),
+        dtype=np.float64,
+        count=count,
+    )
+    alphas = np.fromiter(
+        (cable.conductor_temp_coefficient_per_c or 0.0 for cable in cables),
+        dtype=np.float64,
+        count=count,
+    )
+
+    with np.errstate(invalid="ignore"):
+        resistance = resistivities * (1.0 + alphas * (temperature_c - 20.0)) / np.maximum(areas, 1e-12)
+        valid = (currents > 0.0) & (areas > 0.0) & (resistivities > 0.0) & (resistance > 0.0)
+    return np.where(valid, currents**2 * resistance, np.nan)
+
+
+def _resample_temperature_field(
+    result: CableFemResult,
+    x_nodes_mm: Sequence[float],
+    y_nodes_mm: Sequence[float],
+) -> NDArray[np.float64]:
+    """Bilinearly interpolate a solved temperature grid onto another (graded) node layout."""
+    field = np.asarray(result.temperatures_c, dtype=float)
+    ix, tx = _linear_weights(np.asarray(result.grid_x_mm, dtype=float), np.asarray(x_nodes_mm, dtype=float))
+    iy, ty = _linear_weights(np.asarray(result.grid_y_mm, dtype=float), np.asarray(y_nodes_mm, dtype=float))
+    along_x = field[:, ix] * (1.0 - tx) + field[:, ix + 1] * tx
+    return along_x[iy, :] * (1.0 - ty)[:, None] + along_x[iy + 1, :] * ty[:, None]
+
+
+def _linear_weights(
+    source: NDArray[np.float64],
+    target: NDArray[np.float64],
+) -> Tuple[NDArray[np.intp], NDArray[np.float64]]:
+    index = np.clip(np.searchsorted(source, target, side="right") - 1, 0, source.size - 2)
+    span = source[index + 1] - source[index]
+    weight = np.clip((target - source[index]) / span, 0.0, 1.0)
+    return index, weight
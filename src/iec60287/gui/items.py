@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+from numpy.typing import NDArray
 from PySide6.QtCore import QPointF, QRectF, Qt, Signal
 from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen
-from PySide6.QtWidgets import QGraphicsItem, QGraphicsObject
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsObject, QStyleOptionGraphicsItem
+from iec60287.gui._geom_kernels import any_overlap, within_bounds
 from iec60287.model import (
     CableSystem,
     CableSystemKind,
@@ -14,6 +17,32 @@ from iec60287.model import (
     MaterialClassification,
 )
 
+_LABEL_FONT: Optional[QFont] = None
+
+
+def _build_ring_offsets(max_level: int) -> NDArray[np.float64]:
+    """Grid offsets ordered ring by ring (Chebyshev distance), nearest first within each ring."""
+    axis = np.arange(-max_level, max_level + 1, dtype=np.float64)
+    offsets = np.stack(np.meshgrid(axis, axis, indexing="ij"), axis=-1).reshape(-1, 2)
+    ring = np.abs(offsets).max(axis=1)
+    order = np.lexsort((np.hypot(offsets[:, 0], offsets[:, 1]), ring))
+    offsets = offsets[order]
+    return offsets[ring[order] > 0]
+
+
+_RING_OFFSETS = _build_ring_offsets(40)
+
+
+def _label_font() -> QFont:
+    """Return the shared label font, created on first use once a QGuiApplication exists."""
+    global _LABEL_FONT
+    if _LABEL_FONT is None:
+        font = QFont()
+        font.setPointSizeF(9)
+        _LABEL_FONT = font
+    return _LABEL_FONT
+
+
 class BaseGraphicsItem(QGraphicsObject):
     """Shared behaviour for placement items."""
 
@@ -26,8 +55,12 @@ class BaseGraphicsItem(QGraphicsObject):
             | QGraphicsObject.ItemSendsGeometryChanges
         )
         self.setAcceptHoverEvents(True)
+        # Items only repaint on hover, selection or edits; drags just blit the cached pixmap.
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.setZValue(z_value)
         self._hovered: bool = False
+        # Pens keyed by (rgba, selected, hovered); cleared whenever either state flips.
+        self._pen_cache: Dict[Tuple[int, bool, bool], QPen] = {}
 
     def label(self) -> str:
         return self._label
@@ -38,26 +71,37 @@ class BaseGraphicsItem(QGraphicsObject):
 
     def hoverEnterEvent(self, _) -> None:  # type: ignore[override]
         self._hovered = True
+        self._pen_cache.clear()
         self.update()
 
     def hoverLeaveEvent(self, _) -> None:  # type: ignore[override]
         self._hovered = False
+        self._pen_cache.clear()
         self.update()
 
     def _pen(self, base_colour: QColor) -> QPen:
+        selected = self.isSelected()
+        key = (base_colour.rgba(), selected, self._hovered)
+        pen = self._pen_cache.get(key)
+        if pen is not None:
+            return pen
+
         colour = QColor(base_colour)
-        if self.isSelected():
+        if selected:
             colour = colour.lighter(140)
         elif self._hovered:
             colour = colour.lighter(120)
 
         pen = QPen(colour, 2.0)
         pen.setCosmetic(True)
+        self._pen_cache[key] = pen
         return pen
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
         result = super().itemChange(change, value)
-        if change == QGraphicsItem.ItemPositionHasChanged:
+        if change == QGraphicsItem.ItemSelectedHasChanged:
+            self._pen_cache.clear()
+        elif change == QGraphicsItem.ItemPositionHasChanged:
             scene = self.scene()
             mark = getattr(scene, "mark_structure_changed", None)
             if callable(mark):
@@ -78,6 +122,7 @@ class CableItem(BaseGraphicsItem):
         super().__init__(label, z_value=10.0)
         self.radius = radius
         self.colour = colour or QColor("#2b8a3e")
+        self._label_rect = QRectF(-radius, -radius, radius * 2.0, radius * 2.0)
 
     def boundingRect(self) -> QRectF:  # type: ignore[override]
         padding = 3.0
@@ -88,15 +133,11 @@ class CableItem(BaseGraphicsItem):
         painter.setRenderHint(QPainter.Antialiasing, True)
         painter.setPen(self._pen(self.colour.darker(150)))
         painter.setBrush(self.colour)
-        diameter = self.radius * 2
         painter.drawEllipse(QPointF(0, 0), self.radius, self.radius)
 
-        font = QFont()
-        font.setPointSizeF(9)
-        painter.setFont(font)
+        painter.setFont(_label_font())
         painter.setPen(Qt.white)
-        label_rect = QRectF(-(diameter / 2), -(diameter / 2), diameter, diameter)
-        painter.drawText(label_rect, Qt.AlignCenter, self.label())
+        painter.drawText(self._label_rect, Qt.AlignCenter, self.label())
 
 
 class CableSystemItem(BaseGraphicsItem):
@@ -110,7 +151,19 @@ class CableSystemItem(BaseGraphicsItem):
         QColor("#c2255c"),
         QColor("#2b8a3e"),
     )
+    _PHASE_EDGE_COLOURS = tuple(colour.darker(180) for colour in _PHASE_COLOURS)
     _DUCT_COLOUR = QColor("#5f5f5f")
+    _DUCT_INNER_COLOUR = _DUCT_COLOUR.darker(140)
+    _DUCT_FILL_COLOUR = QColor(95, 95, 95, 30)
+    _OVERLAP_CLEARANCE_MM = 0.5
+    # Moves shorter than this (from the last fully validated position) skip the neighbour test;
+    # kept below the overlap clearance so accumulated drag noise can never create a real overlap.
+    _MOVE_EPSILON_MM = 0.25
+    # Below these on-screen sizes (pixels) paint drops layer detail and phase labels respectively.
+    _LOD_MIN_ITEM_PX = 6.0
+    _LOD_MIN_LABEL_PX = 8.0
+    # Candidate positions tested per NumPy batch during the ring search.
+    _SEARCH_CHUNK = 256
     ROLE_COLOURS: Dict[LayerRole, QColor] = {
         LayerRole.INNER_SCREEN: QColor("#495057"),
         LayerRole.OUTER_SCREEN: QColor("#343a40"),
@@ -126,15 +179,33 @@ class CableSystemItem(BaseGraphicsItem):
         MaterialClassification.INSULATING: QColor("#f6b026"),
         MaterialClassification.PROTECTIVE: QColor("#748ffc"),
     }
+    # (fill, edge) pairs resolved once so geometry rebuilds share colours rather than copying them.
+    _ROLE_PAINT_COLOURS: Dict[LayerRole, Tuple[QColor, QColor]] = {
+        role: (colour, colour.darker(160)) for role, colour in ROLE_COLOURS.items()
+    }
+    _CLASSIFICATION_PAINT_COLOURS: Dict[MaterialClassification, Tuple[QColor, QColor]] = {
+        classification: (colour, colour.darker(160)) for classification, colour in CLASSIFICATION_COLOURS.items()
+    }
+    _FALLBACK_PAINT_COLOURS: Tuple[QColor, QColor] = (QColor("#adb5bd"), QColor("#adb5bd").darker(160))
 
     def __init__(self, system: CableSystem) -> None:
         super().__init__(system.name, z_value=10.0)
         self.system = system
-        self._phase_geometry: List[Tuple[QPointF, float]] = []
+        # Phase envelopes (cable or duct outlines) in item coordinates, stored as parallel arrays.
+        self._centres_xy: NDArray[np.float64] = np.empty((0, 2), dtype=np.float64)
+        self._diameters: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self._radii: NDArray[np.float64] = np.empty(0, dtype=np.float64)
         self._phase_profiles: List[dict] = []
+        self._geometry_key: Optional[tuple] = None
+        self._duct_outer_path = QPainterPath()
+        self._duct_inner_path = QPainterPath()
+        self._layer_batches: List[Tuple[QPainterPath, QColor, QColor]] = []
         self._label_rect = QRectF()
         self._cached_rect = QRectF()
+        self._last_valid_pos: Optional[QPointF] = None
         self.scene_config = None
+        # (left, right, top, bottom) in scene mm, pushed by the scene whenever its config changes.
+        self.trench_bounds: Optional[Tuple[float, float, float, float]] = None
         self._update_geometry_cache()
 
     def rename(self, label: str) -> None:
@@ -144,13 +215,20 @@ class CableSystemItem(BaseGraphicsItem):
 
     def update_system(self, system: CableSystem) -> None:
         """Replace the underlying cable system details."""
-        self.prepareGeometryChange()
         self.system = system
         super().rename(system.name)
-        self._update_geometry_cache()
+        signature = self._geometry_signature()
+        if signature != self._geometry_key:
+            # Edits to names, currents or other non-geometric fields keep the cached outlines.
+            self.prepareGeometryChange()
+            self._update_geometry_cache(signature)
+        self._last_valid_pos = None
         self.ensure_valid_position()
         self.update()
         scene = self.scene()
+        reindex = getattr(scene, "update_spatial_index", None)
+        if callable(reindex):
+            reindex(self)
         mark = getattr(scene, "mark_structure_changed", None)
         if callable(mark):
             mark()
@@ -170,65 +248,59 @@ class CableSystemItem(BaseGraphicsItem):
             painter.drawText(self._label_rect, Qt.AlignCenter, self.label())
             return
 
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        if lod * self._cached_rect.width() < self._LOD_MIN_ITEM_PX:
+            # A few pixels across: the concentric layers are invisible, so draw one disc per phase.
+            painter.setPen(Qt.NoPen)
+            for index, profile in enumerate(self._phase_profiles):
+                radius = profile["outer_radius"]
+                painter.setBrush(self._PHASE_COLOURS[index % len(self._PHASE_COLOURS)])
+                painter.drawEllipse(profile["centre"], radius, radius)
+            self._paint_selection_outline(painter)
+            return
+
+        if not self._duct_outer_path.isEmpty():
+            painter.setPen(self._pen(self._DUCT_COLOUR))
+            painter.setBrush(self._DUCT_FILL_COLOUR)
+            painter.drawPath(self._duct_outer_path)
+            if not self._duct_inner_path.isEmpty():
+                inner_pen = QPen(self._DUCT_INNER_COLOUR, 1.0, Qt.DotLine)
+                inner_pen.setCosmetic(True)
+                painter.setPen(inner_pen)
+                painter.setBrush(Qt.NoBrush)
+                painter.drawPath(self._duct_inner_path)
+
+        # One path per layer depth and colour pair, outermost first, so inner layers cover outer ones.
+        for path, colour, edge_colour in self._layer_batches:
+            painter.setPen(self._pen(edge_colour))
+            painter.setBrush(colour)
+            painter.drawPath(path)
+
         for index, profile in enumerate(self._phase_profiles):
             centre: QPointF = profile["centre"]
             conductor_radius: float = profile["conductor_radius"]
-            layers: List[tuple[LayerSpec, float, float]] = profile["layers"]
-
-            if profile.get("draw_duct"):
-                duct_outer = profile.get("duct_outer_radius") or 0.0
-                if duct_outer > 0.0:
-                    duct_inner = profile.get("duct_inner_radius") or 0.0
-                    duct_colour = QColor(self._DUCT_COLOUR)
-                    fill_colour = QColor(duct_colour)
-                    fill_colour.setAlpha(30)
-                    duct_centre = profile.get("duct_center")
-                    if not isinstance(duct_centre, QPointF):
-                        duct_centre = centre
-                    painter.setPen(self._pen(duct_colour))
-                    painter.setBrush(fill_colour)
-                    painter.drawEllipse(duct_centre, duct_outer, duct_outer)
-                    painter.setBrush(Qt.NoBrush)
-                    if duct_inner > 0.0:
-                        inner_pen = QPen(duct_colour.darker(140), 1.0, Qt.DotLine)
-                        inner_pen.setCosmetic(True)
-                        painter.setPen(inner_pen)
-                        painter.drawEllipse(duct_centre, duct_inner, duct_inner)
-                        painter.setPen(self._pen(duct_colour))
-
-            # Draw layers from outermost to innermost.
-            for layer, _inner, outer in reversed(layers):
-                colour = self._colour_for_layer(layer)
-                painter.setPen(self._pen(colour.darker(160)))
-                painter.setBrush(colour)
-                painter.drawEllipse(centre, outer, outer)
 
             # Draw the conductor core last.
-            conductor_colour = self._PHASE_COLOURS[index % len(self._PHASE_COLOURS)]
-            painter.setPen(self._pen(conductor_colour.darker(180)))
+            phase_index = index % len(self._PHASE_COLOURS)
+            conductor_colour = self._PHASE_COLOURS[phase_index]
+            painter.setPen(self._pen(self._PHASE_EDGE_COLOURS[phase_index]))
             painter.setBrush(conductor_colour)
             painter.drawEllipse(centre, conductor_radius, conductor_radius)
 
+            if lod * conductor_radius * 2.0 < self._LOD_MIN_LABEL_PX:
+                continue
             label = self._PHASE_LABELS[index % len(self._PHASE_LABELS)]
-            font = QFont()
-            font.setPointSizeF(9)
-            painter.setFont(font)
+            painter.setFont(_label_font())
             painter.setPen(Qt.white)
-            label_rect = QRectF(
-                centre.x() - conductor_radius,
-                centre.y() - conductor_radius,
-                conductor_radius * 2.0,
-                conductor_radius * 2.0,
-            )
-            painter.drawText(label_rect, Qt.AlignCenter, label)
+            painter.drawText(profile["label_rect"], Qt.AlignCenter, label)
 
         # Draw system label above the phases.
-        font = QFont()
-        font.setPointSizeF(9)
-        painter.setFont(font)
+        painter.setFont(_label_font())
         painter.setPen(Qt.black)
         painter.drawText(self._label_rect, Qt.AlignCenter, self.label())
+        self._paint_selection_outline(painter)
 
+    def _paint_selection_outline(self, painter: QPainter) -> None:
         if self.isSelected():
             outline = QPen(QColor("#495057"), 1.5, Qt.DashLine)
             outline.setCosmetic(True)
@@ -239,8 +311,29 @@ class CableSystemItem(BaseGraphicsItem):
             rect.adjust(padding, padding, -padding, -padding)
             painter.drawRect(rect)
 
-    def _update_geometry_cache(self) -> None:
-        self._phase_geometry = []
+    def _geometry_signature(self) -> tuple:
+        """Snapshot of every system field the cached outlines and colours depend on."""
+        system = self.system
+        phase = system.single_core_phase
+        duct = system.duct
+        multicore = system.multicore
+        return (
+            system.kind,
+            system.arrangement,
+            system.phase_spacing_mm,
+            (
+                phase.conductor.diameter_mm,
+                tuple((layer.role, layer.thickness_mm, layer.material.classification) for layer in phase.layers),
+            )
+            if phase
+            else None,
+            (duct.inner_diameter_mm, duct.wall_thickness_mm, duct.occupancy) if duct else None,
+            multicore.outer_diameter_mm if multicore else None,
+        )
+
+    def _update_geometry_cache(self, signature: Optional[tuple] = None) -> None:
+        self._geometry_key = signature if signature is not None else self._geometry_signature()
+        geometry: List[Tuple[QPointF, float]] = []
         self._phase_profiles = []
 
         offsets = list(self.system.phase_offsets_mm()) or [(0.0, 0.0)]
@@ -250,6 +343,9 @@ class CableSystemItem(BaseGraphicsItem):
             conductor_radius = phase.conductor.diameter_mm / 2.0
             radial_profile = phase.radial_profile_mm()
             outer_radius = radial_profile[-1][2] if radial_profile else conductor_radius
+            paint_layers: List[Tuple[float, QColor, QColor]] = []
+            for layer, _inner, outer in reversed(radial_profile):
+                paint_layers.append((outer, *self._layer_paint_colours(layer)))
 
             duct = self.system.duct if self.system.duct and self.system.duct.has_valid_geometry() else None
             duct_outer_radius = (duct.outer_diameter_mm / 2.0) if duct else None
@@ -257,9 +353,11 @@ class CableSystemItem(BaseGraphicsItem):
             shared_duct = bool(duct and duct.occupancy is DuctOccupancy.THREE_PHASES_PER_DUCT)
             duct_centre = None
             if shared_duct and offsets:
-                avg_x = sum(offset[0] for offset in offsets) / len(offsets)
-                avg_y = sum(offset[1] for offset in offsets) / len(offsets)
-                duct_centre = QPointF(avg_x, avg_y)
+                sum_x = sum_y = 0.0
+                for offset_x, offset_y in offsets:
+                    sum_x += offset_x
+                    sum_y += offset_y
+                duct_centre = QPointF(sum_x / len(offsets), sum_y / len(offsets))
 
             for index, offset in enumerate(offsets):
                 centre = QPointF(*offset)
@@ -269,47 +367,54 @@ class CableSystemItem(BaseGraphicsItem):
                     if not shared_duct and duct_outer_radius and duct_outer_radius > 0.0:
                         envelope_diameter = max(envelope_diameter, duct_outer_radius * 2.0)
                     draw_duct = (not shared_duct) or index == 0
-                self._phase_geometry.append((centre, envelope_diameter))
+                geometry.append((centre, envelope_diameter))
                 layers_copy = [(layer, inner, outer) for layer, inner, outer in radial_profile]
                 self._phase_profiles.append(
                     {
                         "centre": centre,
                         "conductor_radius": conductor_radius,
                         "layers": layers_copy,
+                        "paint_layers": paint_layers,
                         "outer_radius": outer_radius,
                         "duct_outer_radius": duct_outer_radius,
                         "duct_inner_radius": duct_inner_radius,
                         "draw_duct": draw_duct,
                         "duct_center": duct_centre if shared_duct else centre,
+                        "label_rect": self._circle_rect(centre, conductor_radius),
                     }
                 )
 
             if shared_duct and duct_outer_radius and duct_outer_radius > 0.0 and duct_centre is not None:
-                self._phase_geometry.append((duct_centre, duct_outer_radius * 2.0))
+                geometry.append((duct_centre, duct_outer_radius * 2.0))
         elif self.system.kind is CableSystemKind.MULTICORE and self.system.multicore:
             multicore = self.system.multicore
             diameter = multicore.outer_diameter_mm
             outer_radius = diameter / 2.0
             for offset in offsets:
                 centre = QPointF(*offset)
-                self._phase_geometry.append((centre, diameter))
+                geometry.append((centre, diameter))
                 self._phase_profiles.append(
                     {
                         "centre": centre,
                         "conductor_radius": outer_radius,
                         "layers": [],
+                        "paint_layers": [],
                         "outer_radius": outer_radius,
+                        "label_rect": self._circle_rect(centre, outer_radius),
                     }
                 )
 
-        geometry = self._phase_geometry
+        self._centres_xy = np.array(
+            [(centre.x(), centre.y()) for centre, _diameter in geometry], dtype=np.float64
+        ).reshape(-1, 2)
+        self._diameters = np.array([diameter for _centre, diameter in geometry], dtype=np.float64)
+        self._radii = self._diameters * 0.5
         if geometry:
-            min_x = min(centre.x() - diameter / 2.0 for centre, diameter in geometry)
-            max_x = max(centre.x() + diameter / 2.0 for centre, diameter in geometry)
-            min_y = min(centre.y() - diameter / 2.0 for centre, diameter in geometry)
-            max_y = max(centre.y() + diameter / 2.0 for centre, diameter in geometry)
-            width = max_x - min_x
-            height = max_y - min_y
+            bounds = self._envelope_bounds(self._centres_xy)
+            min_x = bounds.left()
+            min_y = bounds.top()
+            width = bounds.width()
+            height = bounds.height()
             padding = 16.0
             label_height = 24.0
             rect_left = min_x - padding
@@ -329,20 +434,54 @@ class CableSystemItem(BaseGraphicsItem):
                 self._cached_rect.width(),
                 label_height,
             )
-
-    def _colour_for_layer(self, layer: LayerSpec) -> QColor:
-        if layer.role in self.ROLE_COLOURS:
-            return QColor(self.ROLE_COLOURS[layer.role])
-        return QColor(self.CLASSIFICATION_COLOURS.get(layer.material.classification, QColor("#adb5bd")))
+        self._build_paint_batches()
+
+    def _build_paint_batches(self) -> None:
+        """Merge the concentric outlines of every phase into a few paths grouped by pen and brush."""
+        self._duct_outer_path = QPainterPath()
+        self._duct_inner_path = QPainterPath()
+        self._duct_outer_path.setFillRule(Qt.WindingFill)
+        layer_paths: Dict[Tuple[int, int, int], Tuple[QPainterPath, QColor, QColor]] = {}
+        for profile in self._phase_profiles:
+            centre: QPointF = profile["centre"]
+            duct_outer = profile.get("duct_outer_radius") or 0.0
+            if profile.get("draw_duct") and duct_outer > 0.0:
+                duct_centre = profile.get("duct_center")
+                if not isinstance(duct_centre, QPointF):
+                    duct_centre = centre
+                self._duct_outer_path.addEllipse(duct_centre, duct_outer, duct_outer)
+                duct_inner = profile.get("duct_inner_radius") or 0.0
+                if duct_inner > 0.0:
+                    self._duct_inner_path.addEllipse(duct_centre, duct_inner, duct_inner)
+            for depth, (outer, colour, edge_colour) in enumerate(profile["paint_layers"]):
+                key = (depth, colour.rgba(), edge_colour.rgba())
+                batch = layer_paths.get(key)
+                if batch is None:
+                    path = QPainterPath()
+                    path.setFillRule(Qt.WindingFill)
+                    batch = layer_paths[key] = (path, colour, edge_colour)
+                batch[0].addEllipse(centre, outer, outer)
+        self._layer_batches = [layer_paths[key] for key in sorted(layer_paths, key=lambda key: key[0])]
+
+    @staticmethod
+    def _circle_rect(centre: QPointF, radius: float) -> QRectF:
+        return QRectF(centre.x() - radius, centre.y() - radius, radius * 2.0, radius * 2.0)
+
+    def _layer_paint_colours(self, layer: LayerSpec) -> Tuple[QColor, QColor]:
+        pair = self._ROLE_PAINT_COLOURS.get(layer.role)
+        if pair is not None:
+            return pair
+        return self._CLASSIFICATION_PAINT_COLOURS.get(layer.material.classification, self._FALLBACK_PAINT_COLOURS)
 
     def shape(self) -> QPainterPath:  # type: ignore[override]
         path = QPainterPath()
-        if not self._phase_geometry:
+        if not len(self._radii):
             path.addEllipse(QPointF(0.0, 0.0), 1.0, 1.0)
             return path
-        for centre, diameter in self._phase_geometry:
-            radius = diameter / 2.0
-            path.addEllipse(centre, radius, radius)
+        for index in range(len(self._radii)):
+            x, y = self._centres_xy[index]
+            radius = float(self._radii[index])
+            path.addEllipse(QPointF(float(x), float(y)), radius, radius)
         return path
 
     def ensure_valid_position(self) -> None:
@@ -359,82 +498,147 @@ class CableSystemItem(BaseGraphicsItem):
             return
 
         # Fallback radial search using local logic.
-        step = 25.0
-        max_level = 40
-        start = self.pos()
-        for level in range(1, max_level + 1):
-            for dx in range(-level, level + 1):
-                for dy in range(-level, level + 1):
-                    if abs(dx) != level and abs(dy) != level:
-                        continue
-                    candidate = QPointF(start.x() + dx * step, start.y() + dy * step)
-                    if self.position_is_allowed(candidate):
-                        self.setPos(candidate)
-                        return
+        candidate = self.nearest_allowed_position(self.pos(), 25.0)
+        if candidate is not None:
+            self.setPos(candidate)
+
+    def nearest_allowed_position(self, start: QPointF, step: float) -> Optional[QPointF]:
+        """Search rings of grid offsets around ``start`` and return the first position that fits."""
+        candidates = _RING_OFFSETS * step + (start.x(), start.y())
+        offsets = self._centres_xy
+        radii = self._radii
+        if not len(radii):
+            return QPointF(float(candidates[0, 0]), float(candidates[0, 1]))
+        reach = float(np.max(np.abs(offsets) + radii[:, None])) + 1.0
+        min_xy = candidates.min(axis=0) - reach
+        max_xy = candidates.max(axis=0) + reach
+        window = QRectF(min_xy[0], min_xy[1], max_xy[0] - min_xy[0], max_xy[1] - min_xy[1])
+        their_centres, their_radii = self._neighbour_phases(window)
+        limits = self._trench_limits()
+        for first in range(0, len(candidates), self._SEARCH_CHUNK):
+            chunk = candidates[first : first + self._SEARCH_CHUNK]
+            # (candidate, phase, xy) world centres for every candidate in the chunk.
+            centres = chunk[:, None, :] + offsets[None, :, :]
+            allowed = np.ones(len(chunk), dtype=bool)
+            if limits is not None:
+                left, right, top, bottom = limits
+                x = centres[..., 0]
+                y = centres[..., 1]
+                allowed &= np.all(
+                    (x - radii >= left) & (x + radii <= right) & (y - radii >= top) & (y + radii <= bottom),
+                    axis=1,
+                )
+            if their_radii.size:
+                dx = centres[:, :, None, 0] - their_centres[None, None, :, 0]
+                dy = centres[:, :, None, 1] - their_centres[None, None, :, 1]
+                radius_sum = radii[None, :, None] + their_radii[None, None, :] + self._OVERLAP_CLEARANCE_MM
+                allowed &= ~np.any(dx * dx + dy * dy < radius_sum * radius_sum, axis=(1, 2))
+            hits = np.flatnonzero(allowed)
+            if hits.size:
+                x, y = chunk[hits[0]]
+                return QPointF(float(x), float(y))
+        return None
+
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
         if change == QGraphicsItem.ItemPositionChange and self.scene():
             if isinstance(value, QPointF):
-                if not self.position_is_allowed(value):
+                if not self._move_is_allowed(value):
                     return self.pos()
+        elif change == QGraphicsItem.ItemSceneHasChanged:
+            self._last_valid_pos = None
         result = super().itemChange(change, value)
         if change == QGraphicsItem.ItemPositionHasChanged:
+            reindex = getattr(self.scene(), "update_spatial_index", None)
+            if callable(reindex):
+                reindex(self)
             self.positionChanged.emit(self.pos())
+        elif change == QGraphicsItem.ItemSelectedHasChanged:
+            track = getattr(self.scene(), "set_selected_system", None)
+            if callable(track):
+                track(self, bool(value))
         return result
 
+    def _move_is_allowed(self, pos: QPointF) -> bool:
+        last = self._last_valid_pos
+        if last is not None and (pos - last).manhattanLength() < self._MOVE_EPSILON_MM:
+            return self._within_trench(self._phase_world_centres(pos))
+        allowed = self.position_is_allowed(pos)
+        if allowed:
+            self._last_valid_pos = QPointF(pos)
+        return allowed
+
     def position_is_allowed(self, pos: QPointF) -> bool:
-        geometry = self._phase_world_geometry(pos)
-        if not geometry:
+        if not len(self._radii):
             return True
-        if not self._within_trench(geometry):
+        centres = self._phase_world_centres(pos)
+        if not self._within_trench(centres):
             return False
-        for other in self._other_system_items():
-            for centre, diameter in geometry:
-                for other_centre, other_diameter in other._phase_world_geometry():
-                    if self._circles_overlap(centre, diameter, other_centre, other_diameter):
-                        return False
-        return True
-
-    def _phase_world_geometry(self, pos: Optional[QPointF] = None) -> List[Tuple[QPointF, float]]:
+        # Pad beyond the overlap clearance so near-miss neighbours stay candidates.
+        their_centres, their_radii = self._neighbour_phases(self._envelope_bounds(centres, margin=1.0))
+        if not their_radii.size:
+            return True
+        return not any_overlap(centres, self._radii, their_centres, their_radii, self._OVERLAP_CLEARANCE_MM)
+
+    def world_bounds(self, pos: Optional[QPointF] = None) -> QRectF:
+        """Scene-space bounding box of the phase envelopes at ``pos`` (defaults to the current position)."""
+        if not len(self._radii):
+            base = pos or self.pos()
+            return QRectF(base.x(), base.y(), 0.0, 0.0)
+        return self._envelope_bounds(self._phase_world_centres(pos))
+
+    def _envelope_bounds(self, centres: NDArray[np.float64], margin: float = 0.0) -> QRectF:
+        radii = self._radii[:, None] + margin
+        min_x, min_y = (centres - radii).min(axis=0)
+        max_x, max_y = (centres + radii).max(axis=0)
+        return QRectF(float(min_x), float(min_y), float(max_x - min_x), float(max_y - min_y))
+
+    def _neighbour_phases(self, bounds: QRectF) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """World-space envelope centres and radii of other systems that may intersect ``bounds``."""
+        candidates_near = getattr(self.scene(), "candidates_near", None)
+        if callable(candidates_near):
+            # The placement scene's spatial hash narrows the sweep to nearby systems.
+            others = [other for other in candidates_near(bounds) if other is not self]
+        else:
+            others = self._other_system_items()
+        if not others:
+            return np.empty((0, 2), dtype=np.float64), np.empty(0, dtype=np.float64)
+        centres = np.concatenate([other._phase_world_centres() for other in others])
+        radii = np.concatenate([other._radii for other in others])
+        return centres, radii
+
+    def _phase_world_centres(self, pos: Optional[QPointF] = None) -> NDArray[np.float64]:
         base = pos or self.pos()
-        return [(QPointF(base.x() + centre.x(), base.y() + centre.y()), diameter) for centre, diameter in self._phase_geometry]
+        return self._centres_xy + (base.x(), base.y())
 
     def _other_system_items(self) -> List["CableSystemItem"]:
-        if not self.scene():
+        scene = self.scene()
+        if not scene:
             return []
+        system_items = getattr(scene, "system_items", None)
+        if callable(system_items):
+            # The placement scene tracks its systems already; no need to sweep every scene item.
+            return [item for item in system_items() if item is not self]
         items: List[CableSystemItem] = []
-        for item in self.scene().items():
+        for item in scene.items():
             if isinstance(item, CableSystemItem) and item is not self:
                 items.append(item)
         return items
 
-    def _circles_overlap(
-        self,
-        c1: QPointF,
-        d1: float,
-        c2: QPointF,
-        d2: float,
-        clearance: float = 0.5,
-    ) -> bool:
-        radius_sum = (d1 + d2) / 2.0 + clearance
-        dx = c1.x() - c2.x()
-        dy = c1.y() - c2.y()
-        return dx * dx + dy * dy < radius_sum * radius_sum
-
-    def _within_trench(self, geometry: List[Tuple[QPointF, float]]) -> bool:
+    def _trench_limits(self) -> Optional[Tuple[float, float, float, float]]:
+        if self.trench_bounds is not None:
+            return self.trench_bounds
         if not getattr(self, "scene_config", None):
-            return True
+            return None
         config = self.scene_config
-        left = -config.trench_width_mm / 2.0
-        right = config.trench_width_mm / 2.0
         top = config.surface_level_y
-        bottom = top + config.trench_depth_mm
-        for centre, diameter in geometry:
-            radius = diameter / 2.0
-            if centre.x() - radius < left or centre.x() + radius > right:
-                return False
-            if centre.y() - radius < top or centre.y() + radius > bottom:
-                return False
-        return True
+        return (-config.trench_width_mm / 2.0, config.trench_width_mm / 2.0, top, top + config.trench_depth_mm)
+
+    def _within_trench(self, centres: NDArray[np.float64]) -> bool:
+        limits = self._trench_limits()
+        if limits is None:
+            return True
+        left, right, top, bottom = limits
+        return within_bounds(centres, self._radii, left, right, top, bottom)
 
 
 class BackfillItem(BaseGraphicsItem):
@@ -469,8 +673,6 @@ class BackfillItem(BaseGraphicsItem):
         rect = QRectF(-(self.width / 2), -(self.height / 2), self.width, self.height)
         painter.drawRoundedRect(rect, 6.0, 6.0)
 
-        font = QFont()
-        font.setPointSizeF(9)
-        painter.setFont(font)
+        painter.setFont(_label_font())
         painter.setPen(Qt.black)
         painter.drawText(rect, Qt.AlignCenter, self.label())
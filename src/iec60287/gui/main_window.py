@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Optional
 
-from PySide6.QtCore import QPointF, QRectF, Qt, QUrl
-from PySide6.QtGui import QAction, QDesktopServices, QKeySequence, QShortcut
+from PySide6.QtCore import QPointF, QSettings, QSignalBlocker, Qt, QTimer, QUrl, Slot
+from PySide6.QtGui import QAction, QCloseEvent, QDesktopServices, QKeySequence, QShowEvent
 from PySide6.QtWidgets import (
     QDockWidget,
     QFileDialog,
@@ -20,17 +20,22 @@ from PySide6.QtWidgets import (
 
 from iec60287.gui.placement_scene import PlacementScene
 from iec60287.gui.view import PlacementView
-from iec60287.gui.items import CableSystemItem
 from iec60287.gui.system_editor import CableSystemEditor
 from iec60287.gui.trench_designer import TrenchDesigner
 from iec60287.gui.ampacity_calculator import CableAmpacityCalculator
-from iec60287.gui.cable_fem import CableFEMPanel
 from iec60287.io import load_scene_configuration, save_scene_configuration
 
+if TYPE_CHECKING:  # pragma: no cover - imported lazily with the FEM dock
+    from iec60287.gui.cable_fem import CableFEMPanel
+
+_SEED_CENTER = QPointF(0.0, 0.0)
+
 
 class MainWindow(QMainWindow):
     """Main application window hosting the placement scene."""
 
+    _CALCULATOR_REFRESH_DELAY_MS = 75
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("IEC 60287 Cable Layout")
@@ -48,16 +53,25 @@ class MainWindow(QMainWindow):
 
         self._system_editor = CableSystemEditor(self)
         self._trench_designer = TrenchDesigner(self.scene, self)
-        self._ampacity_calculator = CableAmpacityCalculator(self.scene, self)
-        self._fem_panel = CableFEMPanel(self.scene, self)
+        # The calculator and FEM panels are built the first time their dock is shown.
+        self._ampacity_calculator: Optional[CableAmpacityCalculator] = None
+        self._fem_panel: Optional["CableFEMPanel"] = None
         self._open_fem_report_action = QAction("FEM Report", self)
         self._open_fem_report_action.triggered.connect(self._open_latest_fem_report)
         self._reports_menu = QMenu("Reports", self)
         self._reports_menu.addAction(self._open_fem_report_action)
-        self._editor_dock = self._create_editor_dock()
-        self._trench_dock = self._create_trench_dock()
-        self._calculator_dock = self._create_calculator_dock()
-        self._fem_dock = self._create_fem_dock()
+        self._editor_dock = self._make_dock(
+            "Cable System Editor", "CableSystemEditorDock", self._system_editor, min_width=320
+        )
+        self._trench_dock = self._make_dock(
+            "Trench Designer", "TrenchDesignerDock", self._trench_designer, min_width=280
+        )
+        self._calculator_dock = self._make_dock(
+            "Cable Ampacity Calculator", "CableAmpacityCalculatorDock", None, min_width=320
+        )
+        self._calculator_dock.visibilityChanged.connect(self._handle_calculator_dock_visibility)
+        self._fem_dock = self._make_dock("Cable FEM", "CableFEMDock", None, min_width=320)
+        self._fem_dock.visibilityChanged.connect(self._handle_fem_dock_visibility)
 
         self._save_layout_action = QAction("Save Layout\u2026", self)
         self._save_layout_action.triggered.connect(self._handle_save_layout)
@@ -68,27 +82,50 @@ class MainWindow(QMainWindow):
 
         self._status_bar = QStatusBar()
         self.setStatusBar(self._status_bar)
+        # Coalesce bursts of selection/scene updates into one status refresh per event-loop pass.
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(0)
+        self._status_timer.timeout.connect(self._flush_status)
+        # Shown by the next status flush in place of the counts, so a confirmation survives
+        # the refresh that the queued structure notifications schedule after it.
+        self._pending_status_message: Optional[str] = None
+        # Calculator refreshes are restarted on every request so a burst of edits costs one pass.
+        self._calculator_timer = QTimer(self)
+        self._calculator_timer.setSingleShot(True)
+        self._calculator_timer.setInterval(self._CALCULATOR_REFRESH_DELAY_MS)
+        self._calculator_timer.timeout.connect(self._flush_calculator_refresh)
+        self._pending_force_fem = False
+        self._pending_systems_refresh = False
+        # Set when a refresh was skipped because the owning dock was hidden; replayed on show.
+        self._calculator_dirty = False
+        self._fem_dirty = False
+        self._fem_dirty_force = False
+        # Fitting before the first show works on a placeholder viewport size, so defer it.
+        self._fit_view_pending = False
 
         self._create_toolbar()
         self.scene.temperatureOverlayAvailableChanged.connect(self._handle_overlay_available_changed)
         self._handle_overlay_available_changed(self.scene.has_temperature_overlay())
-        self._last_structure_revision = self.scene.structure_revision()
         self._create_menus()
-        self._create_shortcuts()
+        self._restore_window_layout()
         self._seed_scene()
         self._update_status()
         self._handle_selection_changed()
-        self.scene.changed.connect(self._handle_scene_changed)
+        # Queued so scene mutations never re-enter the window mid-update (clearing the overlay
+        # dirties the scene again); the handler only flags work for the debounce timers.
+        self.scene.structureChanged.connect(self._handle_structure_changed, Qt.QueuedConnection)
         self.scene.selectionChanged.connect(self._handle_selection_changed)
 
     def _create_toolbar(self) -> None:
         toolbar = QToolBar("Placement")
+        toolbar.setObjectName("PlacementToolbar")
         toolbar.setMovable(False)
         toolbar.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
         self.addToolBar(Qt.TopToolBarArea, toolbar)
 
         add_cable_action = QAction("Add Cable", self)
-        add_cable_action.setShortcut(QKeySequence("Ctrl+Shift+C"))
+        add_cable_action.setShortcuts([QKeySequence("Ctrl+Shift+C"), QKeySequence("N")])
         add_cable_action.triggered.connect(self._handle_add_cable)
         toolbar.addAction(add_cable_action)
 
@@ -146,105 +183,129 @@ class MainWindow(QMainWindow):
         calculations_menu = self.menuBar().addMenu("&Calculations")
         calculations_menu.addAction(self._calculator_dock.toggleViewAction())
         calculations_menu.addAction(self._fem_dock.toggleViewAction())
-        self.menuBar().addMenu(self._reports_menu)
+        # Share the action, not the toolbar button's menu, so each QMenu keeps a single owner.
+        reports_menu = self.menuBar().addMenu("&Reports")
+        reports_menu.addAction(self._open_fem_report_action)
         about_menu = self.menuBar().addMenu("&About")
 
-    def _create_shortcuts(self) -> None:
-        delete_shortcut = QShortcut(QKeySequence.Delete, self)
-        delete_shortcut.activated.connect(self._handle_delete_selected)
-
-        add_cable_shortcut = QShortcut(QKeySequence("N"), self)
-        add_cable_shortcut.activated.connect(self._handle_add_cable)
-
-    def _create_editor_dock(self) -> QDockWidget:
-        dock = QDockWidget("Cable System Editor", self)
-        dock.setObjectName("CableSystemEditorDock")
-        dock.setWidget(self._system_editor)
-        dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
-        dock.setFeatures(
-            QDockWidget.DockWidgetClosable
-            | QDockWidget.DockWidgetMovable
-            | QDockWidget.DockWidgetFloatable
-        )
-        dock.setMinimumWidth(320)
-        self.addDockWidget(Qt.LeftDockWidgetArea, dock)
-        self.resizeDocks([dock], [360], Qt.Horizontal)
-        return dock
-
-    def _create_trench_dock(self) -> QDockWidget:
-        dock = QDockWidget("Trench Designer", self)
-        dock.setObjectName("TrenchDesignerDock")
-        dock.setWidget(self._trench_designer)
-        dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
-        dock.setFeatures(
-            QDockWidget.DockWidgetClosable
-            | QDockWidget.DockWidgetMovable
-            | QDockWidget.DockWidgetFloatable
-        )
-        dock.setMinimumWidth(280)
-        self.addDockWidget(Qt.LeftDockWidgetArea, dock)
-        self.tabifyDockWidget(self._editor_dock, dock)
-        dock.raise_()
-        return dock
-
-    def _create_calculator_dock(self) -> QDockWidget:
-        dock = QDockWidget("Cable Ampacity Calculator", self)
-        dock.setObjectName("CableAmpacityCalculatorDock")
-        dock.setWidget(self._ampacity_calculator)
+    def _make_dock(self, title: str, object_name: str, widget: Optional[QWidget], *, min_width: int) -> QDockWidget:
+        dock = QDockWidget(title, self)
+        dock.setObjectName(object_name)
+        if widget is not None:
+            dock.setWidget(widget)
         dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
         dock.setFeatures(
             QDockWidget.DockWidgetClosable
             | QDockWidget.DockWidgetMovable
             | QDockWidget.DockWidgetFloatable
         )
-        dock.setMinimumWidth(320)
+        dock.setMinimumWidth(min_width)
         self.addDockWidget(Qt.LeftDockWidgetArea, dock)
-        self.tabifyDockWidget(self._editor_dock, dock)
         return dock
 
-    def _create_fem_dock(self) -> QDockWidget:
-        dock = QDockWidget("Cable FEM", self)
-        dock.setObjectName("CableFEMDock")
-        dock.setWidget(self._fem_panel)
-        dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
-        dock.setFeatures(
-            QDockWidget.DockWidgetClosable
-            | QDockWidget.DockWidgetMovable
-            | QDockWidget.DockWidgetFloatable
-        )
-        dock.setMinimumWidth(320)
-        self.addDockWidget(Qt.LeftDockWidgetArea, dock)
-        self.tabifyDockWidget(self._calculator_dock, dock)
-        return dock
+    def _arrange_default_docks(self) -> None:
+        self.resizeDocks([self._editor_dock], [360], Qt.Horizontal)
+        self.tabifyDockWidget(self._editor_dock, self._trench_dock)
+        self._trench_dock.raise_()
+        self.tabifyDockWidget(self._editor_dock, self._calculator_dock)
+        self.tabifyDockWidget(self._calculator_dock, self._fem_dock)
+
+    @staticmethod
+    def _settings() -> QSettings:
+        return QSettings("LabG", "IEC60287")
+
+    def _restore_window_layout(self) -> None:
+        settings = self._settings()
+        geometry = settings.value("window/geometry")
+        if geometry is not None:
+            self.restoreGeometry(geometry)
+        state = settings.value("window/state")
+        # Fall back to the default dock arrangement when nothing was saved or Qt rejects it.
+        if state is None or not self.restoreState(state):
+            self._arrange_default_docks()
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        settings = self._settings()
+        settings.setValue("window/geometry", self.saveGeometry())
+        settings.setValue("window/state", self.saveState())
+        super().closeEvent(event)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        if self._fit_view_pending:
+            self._fit_view_pending = False
+            # Run after the pending layout resizes so the viewport has its final size.
+            QTimer.singleShot(0, self._fit_view)
+
+    # visibilityChanged reports False when a closed dock is shown again, so the handlers
+    # below ask the dock itself rather than trusting the signal argument.
+    @Slot(bool)
+    def _handle_calculator_dock_visibility(self, _visible: bool) -> None:
+        if not self._calculator_dock.isVisible():
+            return
+        if self._ampacity_calculator is None:
+            self._ensure_ampacity_calculator()
+        elif self._calculator_dirty:
+            self._ampacity_calculator.refresh_from_scene()
+        self._calculator_dirty = False
+
+    @Slot(bool)
+    def _handle_fem_dock_visibility(self, _visible: bool) -> None:
+        if not self._fem_dock.isVisible():
+            return
+        if self._fem_panel is None:
+            self._ensure_fem_panel()
+        elif self._fem_dirty:
+            self._fem_panel.schedule_refresh(force=self._fem_dirty_force)
+        self._fem_dirty = False
+        self._fem_dirty_force = False
+
+    def _ensure_ampacity_calculator(self) -> CableAmpacityCalculator:
+        if self._ampacity_calculator is None:
+            # The constructor performs the initial refresh from the scene.
+            self._ampacity_calculator = CableAmpacityCalculator(self.scene, self)
+            self._calculator_dock.setWidget(self._ampacity_calculator)
+        return self._ampacity_calculator
+
+    def _ensure_fem_panel(self) -> "CableFEMPanel":
+        if self._fem_panel is None:
+            # Deferred import: the FEM stack (scikit-fem, SciPy) is only loaded once the dock opens.
+            from iec60287.gui.cable_fem import CableFEMPanel
+
+            self._fem_panel = CableFEMPanel(self.scene, self)
+            self._fem_dock.setWidget(self._fem_panel)
+        return self._fem_panel
 
     def _seed_scene(self) -> None:
-        center = QPointF(0.0, 0.0)
-        self.scene.add_cable(center)
+        self.scene.add_cable(_SEED_CENTER)
         self._fit_view()
         self._trench_designer.refresh_systems()
         self._refresh_calculators(force_fem=True)
 
     def _scene_center(self) -> QPointF:
-        rect = self.view.viewport().rect()
-        return self.view.mapToScene(rect.center())
+        return self.view.scene_center()
 
+    @Slot()
     def _handle_add_cable(self) -> None:
+        # structureChanged and selectionChanged drive the editor, designer and calculator refreshes.
         self.scene.add_cable(self._scene_center())
-        self._handle_selection_changed()
-        self._trench_designer.refresh_systems()
-        self._refresh_calculators()
 
+    @Slot()
     def _handle_delete_selected(self) -> None:
         if self.scene.selectedItems():
             self.scene.remove_selected()
-            self._handle_selection_changed()
-            self._trench_designer.refresh_systems()
-            self._refresh_calculators()
 
+    @Slot()
     def _fit_view(self) -> None:
+        if not self.view.isVisible():
+            self._fit_view_pending = True
+            return
         rect = self.scene.sceneRect()
+        if rect.isEmpty():
+            return
         self.view.fitInView(rect, Qt.KeepAspectRatio)
 
+    @Slot()
     def _handle_save_layout(self) -> None:
         directory = str(self._last_config_path.parent) if self._last_config_path else ""
         filename, _ = QFileDialog.getSaveFileName(
@@ -266,6 +327,7 @@ class MainWindow(QMainWindow):
         self._last_config_path = path
         self._status_bar.showMessage(f"Layout saved to {path.name}", 4000)
 
+    @Slot()
     def _handle_load_layout(self) -> None:
         directory = str(self._last_config_path.parent) if self._last_config_path else ""
         filename, _ = QFileDialog.getOpenFileName(
@@ -286,11 +348,12 @@ class MainWindow(QMainWindow):
         self._handle_selection_changed()
         self._refresh_calculators(force_fem=True)
         self._fit_view()
-        self._last_structure_revision = self.scene.structure_revision()
-        self._status_bar.showMessage(f"Layout loaded from {path.name}", 4000)
+        self._pending_status_message = f"Layout loaded from {path.name}"
+        self._update_status()
 
+    @Slot()
     def _open_latest_fem_report(self) -> None:
-        path = self._fem_panel.latest_heatmap_path()
+        path = self._fem_panel.latest_heatmap_path() if self._fem_panel is not None else None
         if not path:
             QMessageBox.information(
                 self,
@@ -312,52 +375,74 @@ class MainWindow(QMainWindow):
                 "Unable to open the FEM heatmap with the system viewer.",
             )
 
+    @Slot(bool)
     def _handle_overlay_toggled(self, checked: bool) -> None:
         if checked and not self.scene.has_temperature_overlay():
-            self._overlay_action.blockSignals(True)
-            self._overlay_action.setChecked(False)
-            self._overlay_action.blockSignals(False)
+            with QSignalBlocker(self._overlay_action):
+                self._overlay_action.setChecked(False)
             return
         self.scene.set_temperature_overlay_visible(checked)
 
+    @Slot(bool)
     def _handle_overlay_available_changed(self, available: bool) -> None:
         self._overlay_action.setEnabled(available)
         if not available and self._overlay_action.isChecked():
-            self._overlay_action.blockSignals(True)
-            self._overlay_action.setChecked(False)
-            self._overlay_action.blockSignals(False)
+            with QSignalBlocker(self._overlay_action):
+                self._overlay_action.setChecked(False)
 
     def _update_status(self) -> None:
-        item_count = len(self.scene.items())
-        selected = len(self.scene.selectedItems())
-        systems = len(self.scene.systems())
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    @Slot()
+    def _flush_status(self) -> None:
+        if self._pending_status_message is not None:
+            self._status_bar.showMessage(self._pending_status_message, 4000)
+            self._pending_status_message = None
+            return
+        item_count = self.scene.item_count()
+        selected = self.scene.selected_count()
+        systems = self.scene.system_count()
         message = f"Systems: {systems} | Items: {item_count} | Selected: {selected}"
         self._status_bar.showMessage(message)
 
+    @Slot()
     def _handle_selection_changed(self) -> None:
-        selected = next(
-            (item for item in self.scene.selectedItems() if isinstance(item, CableSystemItem)),
-            None,
-        )
+        selected = self.scene.selected_system()
         self._system_editor.set_item(selected)
         self._trench_designer.set_selected_item(selected)
-        self._trench_designer.refresh_systems()
         self._refresh_calculators()
         self._update_status()
 
-    def _handle_scene_changed(self, _regions: Optional[List[QRectF]] = None) -> None:
-        if hasattr(self.scene, "consume_overlay_change_guard") and self.scene.consume_overlay_change_guard():
-            return
-        current_revision = self.scene.structure_revision()
-        if current_revision == self._last_structure_revision:
-            return
-        self._last_structure_revision = current_revision
+    @Slot()
+    def _handle_structure_changed(self) -> None:
         if self.scene.has_temperature_overlay():
             self.scene.clear_temperature_overlay()
+        self._pending_systems_refresh = True
         self._refresh_calculators()
         self._update_status()
 
-
     def _refresh_calculators(self, *, force_fem: bool = False) -> None:
-        self._ampacity_calculator.refresh_from_scene()
-        self._fem_panel.refresh_from_scene(force=force_fem)
+        self._pending_force_fem = self._pending_force_fem or force_fem
+        self._calculator_timer.start()
+
+    @Slot()
+    def _flush_calculator_refresh(self) -> None:
+        force_fem = self._pending_force_fem
+        self._pending_force_fem = False
+        if self._pending_systems_refresh:
+            self._pending_systems_refresh = False
+            self._trench_designer.refresh_systems()
+        # Panels that have never been shown are built, and refreshed, on first show; hidden
+        # panels are only flagged and catch up when their dock becomes visible again.
+        if self._ampacity_calculator is not None:
+            if self._calculator_dock.isVisible():
+                self._ampacity_calculator.refresh_from_scene()
+            else:
+                self._calculator_dirty = True
+        if self._fem_panel is not None:
+            if self._fem_dock.isVisible():
+                self._fem_panel.schedule_refresh(force=force_fem)
+            else:
+                self._fem_dirty = True
+                self._fem_dirty_force = self._fem_dirty_force or force_fem
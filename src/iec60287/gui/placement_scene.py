@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import math
 import uuid
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-from PySide6.QtCore import QPointF, QRectF, Qt, Signal
-from PySide6.QtGui import QColor, QPainter, QPen
-from PySide6.QtWidgets import QGraphicsScene
+import numpy as np
+from numpy.typing import NDArray
+from PySide6.QtCore import QLineF, QPointF, QRectF, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QColor, QImage, QPainter, QPen, QPicture, QPixmap
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsScene
 
+from iec60287.gui._overlay_kernels import overlay_cell_colours
 from iec60287.gui.items import BackfillItem, CableSystemItem
 from iec60287.model import (
     CablePhase,
@@ -31,7 +35,7 @@ class TrenchLayerKind(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TrenchLayer:
     name: str
     kind: TrenchLayerKind
@@ -50,7 +54,34 @@ def default_trench_layers() -> List[TrenchLayer]:
     ]
 
 
-@dataclass
+_LAYER_BASE_COLOURS: Dict[TrenchLayerKind, QColor] = {
+    TrenchLayerKind.GROUND: QColor("#c0a080"),
+    TrenchLayerKind.BACKFILL: QColor("#ffe066"),
+    TrenchLayerKind.CONCRETE: QColor("#adb5bd"),
+    TrenchLayerKind.AIR: QColor("#d0ebff"),
+    TrenchLayerKind.CUSTOM: QColor("#ced4da"),
+}
+_DEFAULT_LAYER_COLOUR = QColor("#ced4da")
+_LAYER_EDGE_PENS: Dict[TrenchLayerKind, QPen] = {
+    kind: QPen(colour.darker(140), 1.0) for kind, colour in _LAYER_BASE_COLOURS.items()
+}
+_DEFAULT_LAYER_EDGE_PEN = QPen(_DEFAULT_LAYER_COLOUR.darker(140), 1.0)
+# Fill for the part of the trench not covered by any configured layer.
+_UNLAYERED_COLOUR = QColor("#d7ccc8")
+_UNLAYERED_EDGE_PEN = QPen(_UNLAYERED_COLOUR.darker(140), 1.0)
+_TRENCH_OUTLINE_PEN = QPen(QColor("#795548"), 2.0)
+
+
+def _surface_pen() -> QPen:
+    pen = QPen(QColor("#5d4037"), 3.0)
+    pen.setCosmetic(True)
+    return pen
+
+
+_SURFACE_PEN = _surface_pen()
+
+
+@dataclass(slots=True)
 class SceneConfig:
     scene_size: float = 2000.0  # mm
     minor_grid: float = 25.0
@@ -61,21 +92,84 @@ class SceneConfig:
     trench_width_mm: float = 1200.0
     trench_depth_mm: float = 1200.0
     surface_level_y: float = 0.0
-    layers: List[TrenchLayer] = field(default_factory=default_trench_layers)
-
-
-@dataclass
-class TemperatureOverlayCell:
-    rect: QRectF
-    colour: QColor
+    layers: Tuple[TrenchLayer, ...] = field(default_factory=lambda: tuple(default_trench_layers()))
 
 
 @dataclass
 class TemperatureOverlay:
-    cells: List[TemperatureOverlayCell]
     bounds: QRectF
     min_temp_c: float
     max_temp_c: float
+    # Raster of the field stretched over ``bounds``; when set, the cell arrays are empty.
+    image: Optional[QImage] = None
+    # Otherwise one row per cell: (left, top, width, height) and its packed ARGB32 colour.
+    cell_rects: NDArray[np.float64] = field(default_factory=lambda: np.empty((0, 4)))
+    cell_colours: NDArray[np.uint32] = field(default_factory=lambda: np.empty(0, dtype=np.uint32))
+
+
+_DEFAULT_CONDUCTOR = ConductorSpec(area_mm2=240.0, diameter_mm=17.6, material=material_catalog.COPPER)
+_DEFAULT_LAYERS: Tuple[LayerSpec, ...] = (
+    LayerSpec(role=LayerRole.INNER_SCREEN, thickness_mm=1.2, material=material_catalog.SEMI_CONDUCTOR),
+    LayerSpec(role=LayerRole.INSULATION, thickness_mm=5.5, material=material_catalog.XLPE),
+    LayerSpec(role=LayerRole.OUTER_SCREEN, thickness_mm=1.2, material=material_catalog.SEMI_CONDUCTOR),
+    LayerSpec(role=LayerRole.SHEATH, thickness_mm=2.5, material=material_catalog.PVC),
+    LayerSpec(role=LayerRole.SERVING, thickness_mm=1.2, material=material_catalog.PE_SERVING),
+)
+
+
+def _valid_spans(nodes: np.ndarray) -> np.ndarray:
+    """Mask of node intervals with finite, non-coincident ends (``math.isclose`` tolerance)."""
+    lower = nodes[:-1]
+    upper = nodes[1:]
+    finite = np.isfinite(lower) & np.isfinite(upper)
+    with np.errstate(invalid="ignore"):
+        distinct = np.abs(upper - lower) > 1e-9 * np.maximum(np.abs(lower), np.abs(upper))
+    return finite & distinct
+
+
+# Largest overlay raster side (pixels); finer meshes are sampled at this resolution.
+_OVERLAY_IMAGE_MAX_PX = 2048
+_OVERLAY_ALPHA = round(0.6 * 255)
+
+
+def _hues_to_argb(hues: np.ndarray) -> np.ndarray:
+    """Pack fully saturated, full-value HSV hues in ``[0, 1]`` as ARGB32 words at the overlay alpha."""
+    sector = hues * 6.0
+    index = np.floor(sector).astype(np.int64) % 6
+    rising = sector - np.floor(sector)
+    falling = 1.0 - rising
+    ones = np.ones_like(hues)
+    zeros = np.zeros_like(hues)
+    red = np.choose(index, (ones, falling, zeros, zeros, rising, ones))
+    green = np.choose(index, (rising, ones, ones, falling, zeros, zeros))
+    blue = np.choose(index, (zeros, zeros, rising, ones, ones, falling))
+    channels = [np.rint(channel * 255.0).astype(np.uint32) for channel in (red, green, blue)]
+    return (np.uint32(_OVERLAY_ALPHA) << 24) | (channels[0] << 16) | (channels[1] << 8) | channels[2]
+
+
+# Blue (coolest) to red (hottest) ramp, indexed by the temperature fraction scaled to 0..255.
+_OVERLAY_LUT_STEPS = 256
+_OVERLAY_LUT = _hues_to_argb((240.0 - 240.0 * np.linspace(0.0, 1.0, _OVERLAY_LUT_STEPS)) / 360.0)
+
+
+def _raster_axis(nodes: np.ndarray) -> np.ndarray:
+    """Cell index sampled by each raster pixel along an increasing node axis."""
+    spans = np.diff(nodes)
+    cells = spans.size
+    if np.allclose(spans, spans[0]):
+        return np.arange(cells)
+    # Half the finest spacing per pixel keeps every cell at least one pixel wide.
+    total = nodes[-1] - nodes[0]
+    pixels = int(min(max(math.ceil(2.0 * total / spans.min()), cells), _OVERLAY_IMAGE_MAX_PX))
+    centres = nodes[0] + (np.arange(pixels) + 0.5) * (total / pixels)
+    return np.clip(np.searchsorted(nodes, centres, side="right") - 1, 0, cells - 1)
+
+
+def _overlay_image(xs: np.ndarray, ys: np.ndarray, colours: np.ndarray) -> QImage:
+    pixels = np.ascontiguousarray(colours[np.ix_(_raster_axis(ys), _raster_axis(xs))])
+    height, width = pixels.shape
+    # copy() detaches the image from the NumPy buffer.
+    return QImage(pixels.data, width, height, width * 4, QImage.Format_ARGB32).copy()
 
 
 class PlacementScene(QGraphicsScene):
@@ -83,12 +177,29 @@ class PlacementScene(QGraphicsScene):
 
     temperatureOverlayAvailableChanged = Signal(bool)
     temperatureOverlayUpdated = Signal()
+    # Emitted whenever systems are added, removed, moved or edited, or the trench changes.
+    structureChanged = Signal()
+
+    # Uniform-grid bucket size (mm) for the cable system collision index.
+    _SPATIAL_CELL_MM = 200.0
+    # Largest cached grid tile (device pixels per side); zoomed further in, few lines are visible.
+    _GRID_TILE_MAX_PX = 256
+    # The minor grid is skipped once its lines would sit closer than this on screen.
+    _GRID_MIN_MINOR_SPACING_PX = 3.0
+    # Upper bound on lines issued per grid pass when drawing without the cached tile.
+    _GRID_MAX_LINES = 4000
+    # Line batches kept for the untiled path, keyed by step and grid-index bounds.
+    _GRID_LINE_CACHE_SIZE = 8
+    # Device-pixel padding around partial background invalidations (covers the 3 px surface pen).
+    _BACKGROUND_DIRTY_MARGIN_PX = 4.0
 
     def __init__(self, config: Optional[SceneConfig] = None) -> None:
         self.config = config or SceneConfig()
         half = self.config.scene_size / 2.0
         rect = QRectF(-half, -half, self.config.scene_size, self.config.scene_size)
         super().__init__(rect)
+        # Items move constantly while dragging and collisions use our own spatial hash,
+        # so a BSP index would only add per-move rebuild cost.
         self.setItemIndexMethod(QGraphicsScene.NoIndex)
 
         self._cable_count = 0
@@ -96,8 +207,31 @@ class PlacementScene(QGraphicsScene):
         self._systems: Dict[str, CableSystemItem] = {}
         self._temperature_overlay: Optional[TemperatureOverlay] = None
         self._temperature_overlay_visible = False
-        self._overlay_change_guard = 0
         self._structure_revision = 0
+        self._spatial_index: Dict[Tuple[int, int], Set[CableSystemItem]] = {}
+        self._spatial_cells: Dict[CableSystemItem, Tuple[Tuple[int, int], ...]] = {}
+        self._trench_bounds = self._compute_trench_bounds()
+        # Recorded lazily on the next background paint; reset whenever the trench config changes.
+        self._trench_picture: Optional[QPicture] = None
+        self._painted_trench_extent = self._trench_extent()
+        self._background_grid_signature = self._grid_signature()
+        self._grid_tile: Optional[QPixmap] = None
+        self._grid_tile_key: Optional[Tuple[int, int, float, int, int]] = None
+        self._minor_grid_pen, self._major_grid_pen = self._grid_pens()
+        self._grid_line_cache: "OrderedDict[Tuple[float, int, int, int, int], List[QLineF]]" = OrderedDict()
+        self._item_count = 0
+        self._selected_count: Optional[int] = None
+        # Maintained from CableSystemItem.itemChange; rescanned only after the cached item drops out.
+        self._selected_system: Optional[CableSystemItem] = None
+        self._selected_system_stale = False
+        self.selectionChanged.connect(self._invalidate_selected_count)
+        # Repaints from a burst of config edits (width, depth, layers) are merged into one pass.
+        self._background_timer = QTimer(self)
+        self._background_timer.setSingleShot(True)
+        self._background_timer.setInterval(0)
+        self._background_timer.timeout.connect(self._flush_background_invalidation)
+        self._pending_background_rect: Optional[QRectF] = None
+        self._pending_background_reset = False
         self.temperatureOverlayAvailableChanged.emit(False)
 
     def add_cable(self, position: Optional[QPointF] = None) -> CableSystemItem:
@@ -110,12 +244,9 @@ class PlacementScene(QGraphicsScene):
     def remove_selected(self) -> None:
         removed = False
         for item in list(self.selectedItems()):
-            if isinstance(item, CableSystemItem):
-                self._systems.pop(item.system.identifier, None)
-                removed = True
             self.removeItem(item)
             removed = True
-        self.invalidate()
+        # removeItem schedules a repaint of each item's old area; the background is untouched.
         if removed:
             self.mark_structure_changed()
 
@@ -131,14 +262,15 @@ class PlacementScene(QGraphicsScene):
         self.addItem(item)
         if isinstance(item, CableSystemItem):
             item.scene_config = self.config
+            item.trench_bounds = self._trench_bounds
             if enforce_spacing:
                 best_pos = self._find_available_position(item, item.pos())
                 if best_pos != item.pos():
                     item.setPos(best_pos)
             self._systems[item.system.identifier] = item
+            self.update_spatial_index(item)
         self.clearSelection()
         item.setSelected(True)
-        self.invalidate()
         self.mark_structure_changed()
         return item
 
@@ -164,36 +296,76 @@ class PlacementScene(QGraphicsScene):
             return
         for item in list(self._systems.values()):
             self.removeItem(item)
-        self._systems.clear()
         self._cable_count = 0
         self.clearSelection()
-        self.invalidate()
-        self.update()
         self.mark_structure_changed()
 
     def drawBackground(self, painter: QPainter, rect: QRectF) -> None:  # type: ignore[override]
         painter.fillRect(rect, self.config.background_colour)
         painter.setRenderHint(QPainter.Antialiasing, False)
 
-        self._draw_trench(painter, rect)
+        if self._trench_picture is None:
+            self._trench_picture = self._record_trench()
+        painter.drawPicture(0, 0, self._trench_picture)
 
-        def draw_grid(step: float, colour: QColor) -> None:
-            left = int(rect.left() // step - 1)
-            right = int(rect.right() // step + 1)
-            top = int(rect.top() // step - 1)
-            bottom = int(rect.bottom() // step + 1)
+        grid_rect = rect.intersected(self.sceneRect())
+        if grid_rect.isEmpty():
+            return
+        show_minor = self.config.minor_grid * self._device_scale(painter) >= self._GRID_MIN_MINOR_SPACING_PX
+
+        tile = self._grid_tile_for(painter, show_minor)
+        if tile is not None:
+            # Anchor the tiling on the major grid so partial repaints line up with full ones.
+            major = self.config.major_grid
+            left = math.floor(grid_rect.left() / major) * major
+            top = math.floor(grid_rect.top() / major) * major
+            anchored = QRectF(left, top, grid_rect.right() - left, grid_rect.bottom() - top)
+            painter.save()
+            painter.setClipRect(grid_rect, Qt.IntersectClip)
+            painter.drawTiledPixmap(anchored, tile)
+            painter.restore()
+            return
 
-            pen = QPen(colour, 0.0)
-            pen.setCosmetic(True)
-            painter.setPen(pen)
+        # Cached batches span whole grid cells, so clip them back to the exposed rect.
+        painter.save()
+        painter.setClipRect(grid_rect, Qt.IntersectClip)
+        if show_minor:
+            self._paint_grid(painter, grid_rect, self.config.minor_grid, self._minor_grid_pen)
+        self._paint_grid(painter, grid_rect, self.config.major_grid, self._major_grid_pen)
+        painter.restore()
 
-            for x in range(left, right + 1):
-                painter.drawLine(x * step, top * step, x * step, bottom * step)
-            for y in range(top, bottom + 1):
-                painter.drawLine(left * step, y * step, right * step, y * step)
+    def _paint_grid(self, painter: QPainter, rect: QRectF, step: float, pen: QPen) -> None:
+        if step <= 0.0:
+            return
+        lines = self._grid_lines(step, rect)
+        if lines is None:
+            return
+        painter.setPen(pen)
+        painter.drawLines(lines)
+
+    def _grid_lines(self, step: float, rect: QRectF) -> Optional[List[QLineF]]:
+        left = math.floor(rect.left() / step)
+        right = math.ceil(rect.right() / step)
+        top = math.floor(rect.top() / step)
+        bottom = math.ceil(rect.bottom() / step)
+        if (right - left) + (bottom - top) + 2 > self._GRID_MAX_LINES:
+            return None
 
-        draw_grid(self.config.minor_grid, self.config.minor_grid_colour)
-        draw_grid(self.config.major_grid, self.config.major_grid_colour)
+        key = (step, left, right, top, bottom)
+        cache = self._grid_line_cache
+        lines = cache.get(key)
+        if lines is not None:
+            cache.move_to_end(key)
+            return lines
+
+        y0, y1 = top * step, bottom * step
+        x0, x1 = left * step, right * step
+        lines = [QLineF(x * step, y0, x * step, y1) for x in range(left, right + 1)]
+        lines.extend(QLineF(x0, y * step, x1, y * step) for y in range(top, bottom + 1))
+        cache[key] = lines
+        if len(cache) > self._GRID_LINE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return lines
 
     def drawForeground(self, painter: QPainter, rect: QRectF) -> None:  # type: ignore[override]
         super().drawForeground(painter, rect)
@@ -204,10 +376,13 @@ class PlacementScene(QGraphicsScene):
             return
         painter.save()
         painter.setRenderHint(QPainter.Antialiasing, False)
+        if overlay.image is not None:
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
+            painter.drawImage(overlay.bounds, overlay.image)
         painter.setPen(Qt.NoPen)
-        for cell in overlay.cells:
-            painter.setBrush(cell.colour)
-            painter.drawRect(cell.rect)
+        for rect, colour in zip(overlay.cell_rects.tolist(), overlay.cell_colours.tolist()):
+            painter.setBrush(QColor.fromRgba(colour))
+            painter.drawRect(QRectF(*rect))
         painter.setRenderHint(QPainter.Antialiasing, True)
 
         label = f"{overlay.min_temp_c:.1f}°C – {overlay.max_temp_c:.1f}°C"
@@ -235,6 +410,107 @@ class PlacementScene(QGraphicsScene):
     def system_items(self) -> List[CableSystemItem]:
         return list(self._systems.values())
 
+    def system_count(self) -> int:
+        return len(self._systems)
+
+    def item_count(self) -> int:
+        """Number of top-level items added through this scene, without building an items() list."""
+        return self._item_count
+
+    def selected_count(self) -> int:
+        if self._selected_count is None:
+            self._selected_count = len(self.selectedItems())
+        return self._selected_count
+
+    def selected_system(self) -> Optional[CableSystemItem]:
+        if self._selected_system_stale:
+            self._selected_system = next(
+                (item for item in self.selectedItems() if isinstance(item, CableSystemItem)),
+                None,
+            )
+            self._selected_system_stale = False
+        return self._selected_system
+
+    def set_selected_system(self, item: CableSystemItem, selected: bool) -> None:
+        """Record a selection change reported by ``item``."""
+        if selected:
+            self._selected_system = item
+            self._selected_system_stale = False
+        elif item is self._selected_system:
+            self._selected_system = None
+            self._selected_system_stale = True
+
+    def addItem(self, item: QGraphicsItem) -> None:  # type: ignore[override]
+        if item.scene() is not self:
+            self._item_count += 1
+        super().addItem(item)
+
+    def removeItem(self, item: QGraphicsItem) -> None:  # type: ignore[override]
+        if item.scene() is self:
+            self._item_count -= 1
+            if item is self._selected_system:
+                self._selected_system = None
+                self._selected_system_stale = True
+            if isinstance(item, CableSystemItem):
+                # Every removal path funnels through here, so the registry never outlives the item.
+                if self._systems.get(item.system.identifier) is item:
+                    del self._systems[item.system.identifier]
+                self.remove_from_spatial_index(item)
+        super().removeItem(item)
+
+    @Slot()
+    def _invalidate_selected_count(self) -> None:
+        self._selected_count = None
+
+    def update_spatial_index(self, item: CableSystemItem) -> None:
+        """Re-bucket ``item`` in the collision index after it moved or changed shape."""
+        if item.scene() is not self:
+            return
+        cells = tuple(self._cells_for_rect(item.world_bounds()))
+        previous = self._spatial_cells.get(item)
+        if previous == cells:
+            return
+        if previous:
+            self._discard_from_cells(item, previous)
+        for cell in cells:
+            self._spatial_index.setdefault(cell, set()).add(item)
+        self._spatial_cells[item] = cells
+
+    def remove_from_spatial_index(self, item: CableSystemItem) -> None:
+        previous = self._spatial_cells.pop(item, None)
+        if previous:
+            self._discard_from_cells(item, previous)
+
+    def candidates_near(self, bounds: QRectF) -> Set[CableSystemItem]:
+        """Return cable systems whose indexed cells overlap ``bounds``."""
+        candidates: Set[CableSystemItem] = set()
+        index = self._spatial_index
+        for cell in self._cells_for_rect(bounds):
+            bucket = index.get(cell)
+            if bucket:
+                candidates.update(bucket)
+        return candidates
+
+    def _cells_for_rect(self, bounds: QRectF) -> Iterable[Tuple[int, int]]:
+        cell = self._SPATIAL_CELL_MM
+        left = math.floor(bounds.left() / cell)
+        right = math.floor(bounds.right() / cell)
+        top = math.floor(bounds.top() / cell)
+        bottom = math.floor(bounds.bottom() / cell)
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                yield (cx, cy)
+
+    def _discard_from_cells(self, item: CableSystemItem, cells: Iterable[Tuple[int, int]]) -> None:
+        index = self._spatial_index
+        for cell in cells:
+            bucket = index.get(cell)
+            if bucket is None:
+                continue
+            bucket.discard(item)
+            if not bucket:
+                del index[cell]
+
     def update_trench_geometry(
         self,
         *,
@@ -250,8 +526,8 @@ class PlacementScene(QGraphicsScene):
             self.config.surface_level_y = surface_level_y
         self.refresh_after_config_change()
 
-    def update_trench_layers(self, layers: List[TrenchLayer]) -> None:
-        self.config.layers = list(layers)
+    def update_trench_layers(self, layers: Iterable[TrenchLayer]) -> None:
+        self.config.layers = tuple(layers)
         self.refresh_after_config_change()
 
     def structure_revision(self) -> int:
@@ -259,6 +535,7 @@ class PlacementScene(QGraphicsScene):
 
     def mark_structure_changed(self) -> None:
         self._structure_revision += 1
+        self.structureChanged.emit()
 
     def has_temperature_overlay(self) -> bool:
         return self._temperature_overlay is not None
@@ -271,9 +548,7 @@ class PlacementScene(QGraphicsScene):
         self._temperature_overlay_visible = visible
         overlay = self._temperature_overlay
         if overlay:
-            self._mark_overlay_refresh()
-            self.invalidate(overlay.bounds)
-        self.update()
+            self._invalidate_overlay(overlay.bounds)
 
     def is_temperature_overlay_visible(self) -> bool:
         return self._temperature_overlay_visible and self._temperature_overlay is not None
@@ -288,15 +563,14 @@ class PlacementScene(QGraphicsScene):
         if overlay is None:
             self.clear_temperature_overlay()
             return
-        was_available = self._temperature_overlay is not None
-        self._mark_overlay_refresh()
+        previous = self._temperature_overlay
         self._temperature_overlay = overlay
-        if not was_available:
+        if previous is None:
             self.temperatureOverlayAvailableChanged.emit(True)
         self.temperatureOverlayUpdated.emit()
         if self._temperature_overlay_visible:
-            self.invalidate(overlay.bounds)
-        self.update()
+            dirty = overlay.bounds if previous is None else overlay.bounds.united(previous.bounds)
+            self._invalidate_overlay(dirty)
 
     def clear_temperature_overlay(self) -> None:
         if self._temperature_overlay is None and not self._temperature_overlay_visible:
@@ -308,34 +582,110 @@ class PlacementScene(QGraphicsScene):
         self._temperature_overlay = None
         was_visible = self._temperature_overlay_visible
         self._temperature_overlay_visible = False
-        self._overlay_change_guard = 0
         if was_available:
             self.temperatureOverlayAvailableChanged.emit(False)
         if was_visible:
-            self.invalidate(overlay_rect)
-        self.update()
+            self._invalidate_overlay(overlay_rect)
+
+    def _invalidate_overlay(self, rect: QRectF) -> None:
+        # The overlay lives in drawForeground only; repainting its bounds is enough.
+        self.invalidate(rect, QGraphicsScene.ForegroundLayer)
 
     def temperature_overlay_bounds(self) -> Optional[QRectF]:
         if not self._temperature_overlay:
             return None
         return QRectF(self._temperature_overlay.bounds)
 
-    def consume_overlay_change_guard(self) -> bool:
-        if self._overlay_change_guard > 0:
-            self._overlay_change_guard -= 1
-            return True
-        return False
+    def trench_bounds(self) -> Tuple[float, float, float, float]:
+        """Return the trench extent as (left, right, top, bottom) in scene millimetres."""
+        return self._trench_bounds
+
+    def _compute_trench_bounds(self) -> Tuple[float, float, float, float]:
+        half_width = self.config.trench_width_mm / 2.0
+        top = self.config.surface_level_y
+        return (-half_width, half_width, top, top + self.config.trench_depth_mm)
+
+    def invalidate_background(self, rect: Optional[QRectF] = None) -> None:
+        """Repaint the cached background within ``rect`` (scene units), or everywhere when omitted."""
+        if rect is None:
+            for view in self.views():
+                view.resetCachedContent()
+            self.update()
+            return
+        for view in self.views():
+            # Cosmetic pens spill a few device pixels past their scene geometry.
+            scale = math.hypot(view.transform().m11(), view.transform().m12()) or 1.0
+            margin = self._BACKGROUND_DIRTY_MARGIN_PX / scale
+            dirty = rect.adjusted(-margin, -margin, margin, margin)
+            view.invalidateScene(dirty, QGraphicsScene.BackgroundLayer)
+            # invalidateScene only schedules a repaint for views that hold a background cache.
+            self.update(dirty)
+
+    @Slot()
+    def _flush_background_invalidation(self) -> None:
+        rect = self._pending_background_rect
+        reset = self._pending_background_reset
+        self._pending_background_rect = None
+        self._pending_background_reset = False
+        if reset:
+            self.invalidate_background()
+        elif rect is not None:
+            self.invalidate_background(rect)
+
+    def _grid_pens(self) -> Tuple[QPen, QPen]:
+        pens = []
+        for colour in (self.config.minor_grid_colour, self.config.major_grid_colour):
+            pen = QPen(colour, 0.0)
+            pen.setCosmetic(True)
+            pens.append(pen)
+        return pens[0], pens[1]
+
+    def _grid_signature(self) -> Tuple[float, float, int, int, int]:
+        config = self.config
+        return (
+            config.minor_grid,
+            config.major_grid,
+            config.minor_grid_colour.rgba(),
+            config.major_grid_colour.rgba(),
+            config.background_colour.rgba(),
+        )
 
-    def _mark_overlay_refresh(self) -> None:
-        self._overlay_change_guard = max(self._overlay_change_guard, 2)
+    def _trench_extent(self) -> QRectF:
+        """Scene rect painted by ``_draw_trench``, including the surface line overhang."""
+        width = self.config.trench_width_mm
+        overhang = width * 0.2
+        return QRectF(
+            -width / 2.0 - overhang,
+            self.config.surface_level_y,
+            width + 2.0 * overhang,
+            self.config.trench_depth_mm,
+        ).adjusted(-1.0, -1.0, 1.0, 1.0)
 
     def refresh_after_config_change(self) -> None:
+        self._trench_bounds = self._compute_trench_bounds()
+        self._trench_picture = None
+        grid_signature = self._grid_signature()
+        if grid_signature != self._background_grid_signature:
+            self._background_grid_signature = grid_signature
+            self._grid_tile = None
+            self._grid_tile_key = None
+            self._grid_line_cache.clear()
+            self._minor_grid_pen, self._major_grid_pen = self._grid_pens()
+            self._pending_background_reset = True
+        else:
+            # Only the trench changed: repaint where it was and where it is now.
+            extent = self._trench_extent()
+            dirty = self._painted_trench_extent.united(extent)
+            if self._pending_background_rect is not None:
+                dirty = dirty.united(self._pending_background_rect)
+            self._pending_background_rect = dirty
+        self._painted_trench_extent = self._trench_extent()
+        self._background_timer.start()
         for item in self._systems.values():
             item.scene_config = self.config
+            item.trench_bounds = self._trench_bounds
             item.ensure_valid_position()
             item.update()
-        self.invalidate()
-        self.update()
         self.mark_structure_changed()
 
     def _default_cable_position(self) -> QPointF:
@@ -345,29 +695,11 @@ class PlacementScene(QGraphicsScene):
     def _build_default_single_core_system(self, index: int) -> CableSystem:
         """Generate a starter single-core system suitable for quick prototyping."""
         name = f"Cable System {index}"
-        copper = material_catalog.COPPER
-        semicon = material_catalog.SEMI_CONDUCTOR
-        xlpe = material_catalog.XLPE
-        pvc = material_catalog.PVC
-        serving = material_catalog.PE_SERVING
-
-        conductor = ConductorSpec(
-            area_mm2=240.0,
-            diameter_mm=17.6,
-            material=copper,
-        )
-        layers = [
-            LayerSpec(role=LayerRole.INNER_SCREEN, thickness_mm=1.2, material=semicon),
-            LayerSpec(role=LayerRole.INSULATION, thickness_mm=5.5, material=xlpe),
-            LayerSpec(role=LayerRole.OUTER_SCREEN, thickness_mm=1.2, material=semicon),
-            LayerSpec(role=LayerRole.SHEATH, thickness_mm=2.5, material=pvc),
-            LayerSpec(role=LayerRole.SERVING, thickness_mm=1.2, material=serving),
-        ]
-
+        # Fresh spec instances per system: specs are mutable and edited per system.
         phase = CablePhase(
             name="Phase",
-            conductor=conductor,
-            layers=layers,
+            conductor=replace(_DEFAULT_CONDUCTOR),
+            layers=[replace(layer) for layer in _DEFAULT_LAYERS],
         )
 
         return CableSystem(
@@ -380,16 +712,65 @@ class PlacementScene(QGraphicsScene):
         )
 
     def _layer_colour(self, layer: TrenchLayer) -> QColor:
-        base_colours = {
-            TrenchLayerKind.GROUND: QColor("#c0a080"),
-            TrenchLayerKind.BACKFILL: QColor("#ffe066"),
-            TrenchLayerKind.CONCRETE: QColor("#adb5bd"),
-            TrenchLayerKind.AIR: QColor("#d0ebff"),
-            TrenchLayerKind.CUSTOM: QColor("#ced4da"),
-        }
-        return base_colours.get(layer.kind, QColor("#ced4da"))
-
-    def _draw_trench(self, painter: QPainter, rect: QRectF) -> None:
+        return _LAYER_BASE_COLOURS.get(layer.kind, _DEFAULT_LAYER_COLOUR)
+
+    @staticmethod
+    def _device_scale(painter: QPainter) -> float:
+        transform = painter.worldTransform()
+        return math.hypot(transform.m11(), transform.m12()) * painter.device().devicePixelRatioF()
+
+    def _grid_tile_for(self, painter: QPainter, show_minor: bool) -> Optional[QPixmap]:
+        """Return one major grid cell rasterised at the painter's scale, or ``None`` to draw lines."""
+        minor = self.config.minor_grid
+        major = self.config.major_grid
+        if minor <= 0.0 or major <= 0.0:
+            return None
+        cells = round(major / minor)
+        if cells < 1 or abs(major / minor - cells) > 1e-6:
+            return None
+        transform = painter.worldTransform()
+        if transform.isRotating() or not math.isclose(transform.m11(), transform.m22()):
+            return None
+        scale = self._device_scale(painter)
+        # Rounding down stretches the tile slightly when blitted, so lines never drop out.
+        size = max(int(major * scale), 1)
+        if size > self._GRID_TILE_MAX_PX:
+            return None
+        if not show_minor:
+            cells = 1
+        key = (size, cells, major, self.config.minor_grid_colour.rgba(), self.config.major_grid_colour.rgba())
+        if self._grid_tile is None or self._grid_tile_key != key:
+            self._grid_tile = self._render_grid_tile(size, cells)
+            self._grid_tile.setDevicePixelRatio(size / major)
+            self._grid_tile_key = key
+        return self._grid_tile
+
+    def _render_grid_tile(self, size: int, cells: int) -> QPixmap:
+        tile = QPixmap(size, size)
+        tile.fill(Qt.transparent)
+        painter = QPainter(tile)
+        step = size / cells
+        lines = []
+        for index in range(1, cells):
+            offset = float(int(index * step))
+            lines.append(QLineF(offset, 0.0, offset, size - 1.0))
+            lines.append(QLineF(0.0, offset, size - 1.0, offset))
+        painter.setPen(self.config.minor_grid_colour)
+        if lines:
+            painter.drawLines(lines)
+        painter.setPen(self.config.major_grid_colour)
+        painter.drawLines([QLineF(0.0, 0.0, 0.0, size - 1.0), QLineF(0.0, 0.0, size - 1.0, 0.0)])
+        painter.end()
+        return tile
+
+    def _record_trench(self) -> QPicture:
+        picture = QPicture()
+        painter = QPainter(picture)
+        self._draw_trench(painter)
+        painter.end()
+        return picture
+
+    def _draw_trench(self, painter: QPainter) -> None:
         width = self.config.trench_width_mm
         depth = self.config.trench_depth_mm
         surface_y = self.config.surface_level_y
@@ -403,26 +784,22 @@ class PlacementScene(QGraphicsScene):
             if thickness <= 0.0 or remaining <= 0.0:
                 continue
             layer_height = min(thickness, remaining)
-            colour = self._layer_colour(layer)
-            painter.setPen(QPen(colour.darker(140), 1.0))
-            painter.setBrush(colour)
+            painter.setPen(_LAYER_EDGE_PENS.get(layer.kind, _DEFAULT_LAYER_EDGE_PEN))
+            painter.setBrush(self._layer_colour(layer))
             painter.drawRect(QRectF(-width / 2.0, current_y, width, layer_height))
             current_y += layer_height
             remaining -= layer_height
 
         if remaining > 0.0:
-            fallback_colour = QColor("#d7ccc8")
-            painter.setPen(QPen(fallback_colour.darker(140), 1.0))
-            painter.setBrush(fallback_colour)
+            painter.setPen(_UNLAYERED_EDGE_PEN)
+            painter.setBrush(_UNLAYERED_COLOUR)
             painter.drawRect(QRectF(-width / 2.0, current_y, width, remaining))
 
-        painter.setPen(QPen(QColor("#795548"), 2.0))
+        painter.setPen(_TRENCH_OUTLINE_PEN)
         painter.setBrush(Qt.NoBrush)
         painter.drawRect(trench_rect)
 
-        surface_pen = QPen(QColor("#5d4037"), 3.0)
-        surface_pen.setCosmetic(True)
-        painter.setPen(surface_pen)
+        painter.setPen(_SURFACE_PEN)
         painter.drawLine(trench_rect.left() - width * 0.2, surface_y, trench_rect.right() + width * 0.2, surface_y)
         painter.restore()
 
@@ -440,100 +817,82 @@ class PlacementScene(QGraphicsScene):
         if columns <= 0 or rows <= 0:
             return None
 
-        temp_rows: List[List[float]] = []
-        for row in temperatures_c:
-            row_values: List[float] = []
-            for value in row:
-                try:
-                    row_values.append(float(value))
-                except (TypeError, ValueError):
-                    row_values.append(float("nan"))
-            temp_rows.append(row_values)
-
-        if len(temp_rows) != len(y_nodes_mm):
-            return None
-        if any(len(row) != len(x_nodes_mm) for row in temp_rows):
+        try:
+            temps = np.asarray(temperatures_c, dtype=np.float64)
+        except (TypeError, ValueError):
+            # Ragged rows or non-numeric entries: coerce value by value, unparsable ones as NaN.
+            temp_rows: List[List[float]] = []
+            for row in temperatures_c:
+                row_values: List[float] = []
+                for value in row:
+                    try:
+                        row_values.append(float(value))
+                    except (TypeError, ValueError):
+                        row_values.append(float("nan"))
+                temp_rows.append(row_values)
+            if len(temp_rows) != len(y_nodes_mm):
+                return None
+            if any(len(row) != len(x_nodes_mm) for row in temp_rows):
+                return None
+            temps = np.asarray(temp_rows, dtype=np.float64)
+
+        if temps.shape != (len(y_nodes_mm), len(x_nodes_mm)):
             return None
 
-        finite_values = [value for row in temp_rows for value in row if math.isfinite(value)]
-        if not finite_values:
+        finite = np.isfinite(temps)
+        if not finite.any():
             return None
 
-        min_temp = min(finite_values)
-        max_temp = max(finite_values)
-        reference_value = finite_values[0]
-
-        cells: List[TemperatureOverlayCell] = []
-
-        for j in range(rows):
-            top_row = temp_rows[j]
-            bottom_row = temp_rows[j + 1]
-            y0 = float(y_nodes_mm[j])
-            y1 = float(y_nodes_mm[j + 1])
-            if not math.isfinite(y0) or not math.isfinite(y1):
-                continue
-            if math.isclose(y0, y1):
-                continue
-            top = min(y0, y1)
-            height = abs(y1 - y0)
-            for i in range(columns):
-                x0 = float(x_nodes_mm[i])
-                x1 = float(x_nodes_mm[i + 1])
-                if not math.isfinite(x0) or not math.isfinite(x1):
-                    continue
-                if math.isclose(x0, x1):
-                    continue
-                left = min(x0, x1)
-                width = abs(x1 - x0)
-                samples = [
-                    top_row[i],
-                    top_row[i + 1],
-                    bottom_row[i],
-                    bottom_row[i + 1],
-                ]
-                valid_samples = [value for value in samples if math.isfinite(value)]
-                if valid_samples:
-                    average = sum(valid_samples) / len(valid_samples)
-                else:
-                    average = reference_value
-                colour = self._temperature_to_colour(average, min_temp, max_temp)
-                cells.append(TemperatureOverlayCell(rect=QRectF(left, top, width, height), colour=colour))
-
-        if not cells:
+        finite_values = temps[finite]
+        min_temp = float(finite_values.min())
+        max_temp = float(finite_values.max())
+        reference_value = float(finite_values[0])
+
+        xs = np.asarray(x_nodes_mm, dtype=np.float64)
+        ys = np.asarray(y_nodes_mm, dtype=np.float64)
+        column_ok = _valid_spans(xs)
+        row_ok = _valid_spans(ys)
+        cell_ok = row_ok[:, None] & column_ok[None, :]
+        if not cell_ok.any():
             return None
 
-        min_x = min(cell.rect.left() for cell in cells)
-        min_y = min(cell.rect.top() for cell in cells)
-        max_x = max(cell.rect.right() for cell in cells)
-        max_y = max(cell.rect.bottom() for cell in cells)
+        # Cells take the mean of their finite corners, falling back to the first finite value.
+        colours = overlay_cell_colours(temps, min_temp, max_temp - min_temp, reference_value, _OVERLAY_LUT)
+
+        if cell_ok.all() and np.all(np.diff(xs) > 0.0) and np.all(np.diff(ys) > 0.0):
+            image = _overlay_image(xs, ys, colours)
+            bounds = QRectF(float(xs[0]), float(ys[0]), float(xs[-1] - xs[0]), float(ys[-1] - ys[0]))
+            return TemperatureOverlay(bounds=bounds, min_temp_c=min_temp, max_temp_c=max_temp, image=image)
+
+        lefts = np.minimum(xs[:-1], xs[1:])
+        widths = np.abs(xs[1:] - xs[:-1])
+        tops = np.minimum(ys[:-1], ys[1:])
+        heights = np.abs(ys[1:] - ys[:-1])
+        row_index, column_index = np.nonzero(cell_ok)
+        cell_rects = np.column_stack(
+            (lefts[column_index], tops[row_index], widths[column_index], heights[row_index])
+        )
+        cell_colours = colours[row_index, column_index]
+
+        used_columns = column_ok.nonzero()[0]
+        used_rows = row_ok.nonzero()[0]
+        min_x = float(lefts[used_columns].min())
+        max_x = float((lefts[used_columns] + widths[used_columns]).max())
+        min_y = float(tops[used_rows].min())
+        max_y = float((tops[used_rows] + heights[used_rows]).max())
         bounds = QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
-        return TemperatureOverlay(cells=cells, bounds=bounds, min_temp_c=min_temp, max_temp_c=max_temp)
-
-    def _temperature_to_colour(self, value: float, minimum: float, maximum: float) -> QColor:
-        span = maximum - minimum
-        if span <= 1e-6:
-            t = 0.5
-        else:
-            t = (value - minimum) / span
-        t = max(0.0, min(1.0, t))
-        hue = (240.0 - 240.0 * t) / 360.0
-        hue = max(0.0, min(1.0, hue))
-        return QColor.fromHsvF(hue, 1.0, 1.0, 0.6)
+        return TemperatureOverlay(
+            bounds=bounds,
+            min_temp_c=min_temp,
+            max_temp_c=max_temp,
+            cell_rects=cell_rects,
+            cell_colours=cell_colours,
+        )
 
     def _find_available_position(self, item: CableSystemItem, start: QPointF) -> QPointF:
         if item.position_is_allowed(start):
             return start
 
         step = max(self.config.minor_grid, 10.0)
-        max_level = 40
-        for level in range(1, max_level + 1):
-            min_offset = -level
-            max_offset = level
-            for dx in range(min_offset, max_offset + 1):
-                for dy in range(min_offset, max_offset + 1):
-                    if abs(dx) != level and abs(dy) != level:
-                        continue
-                    candidate = QPointF(start.x() + dx * step, start.y() + dy * step)
-                    if item.position_is_allowed(candidate):
-                        return candidate
-        return start
+        candidate = item.nearest_allowed_position(start, step)
+        return candidate if candidate is not None else start
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from functools import partial
-from typing import Dict, Optional, Sequence
+from functools import lru_cache, partial
+from typing import Dict, FrozenSet, Optional, Sequence, Tuple
 
 from PySide6.QtCore import QPointF, Qt
 from PySide6.QtWidgets import (
@@ -44,6 +44,12 @@ from iec60287.model import (
 )
 
 
+@lru_cache(maxsize=None)
+def _materials_for(classifications: FrozenSet[MaterialClassification]) -> Tuple[Material, ...]:
+    # The catalogue is static, so each classification set is filtered once per process.
+    return tuple(material_catalog.materials_for_classifications(classifications))
+
+
 @dataclass
 class LayerControl:
     role: LayerRole
@@ -588,9 +594,10 @@ class CableSystemEditor(QWidget):
         combo: QComboBox,
         classifications: Sequence[MaterialClassification],
     ) -> None:
+        materials = _materials_for(frozenset(classifications))
         combo.blockSignals(True)
         combo.clear()
-        for material in material_catalog.materials_for_classifications(classifications):
+        for material in materials:
             combo.addItem(material.name, material)
         combo.addItem("Other", self._CUSTOM_MATERIAL_KEY)
         combo.blockSignals(False)
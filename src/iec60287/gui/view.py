@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PySide6.QtCore import QPoint, Qt
+from PySide6.QtCore import QPoint, QPointF, Qt
 from PySide6.QtGui import QMouseEvent, QPainter, QWheelEvent
 from PySide6.QtWidgets import QGraphicsScene, QGraphicsView
 
@@ -16,12 +16,24 @@ class PlacementView(QGraphicsView):
             | QPainter.SmoothPixmapTransform
         )
         self.setDragMode(QGraphicsView.RubberBandDrag)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # Item paint routines set pen, brush and render hints themselves and pad their
+        # bounding rects, so Qt need not save painter state or grow exposed rects.
+        self.setOptimizationFlags(
+            QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing
+        )
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        # The grid and trench only change with the scene config, which invalidates the
+        # background layer, so item moves repaint from the cached pixmap instead.
+        self.setCacheMode(QGraphicsView.CacheBackground)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
         self._is_panning = False
         self._pan_start = QPoint()
 
+    def scene_center(self) -> QPointF:
+        """Scene position under the viewport centre."""
+        return self.mapToScene(self.viewport().rect().center())
+
     def wheelEvent(self, event: QWheelEvent) -> None:
         delta = event.angleDelta().y()
         if delta == 0: